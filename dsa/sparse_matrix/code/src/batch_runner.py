@@ -0,0 +1,239 @@
+import argparse
+import csv
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from sparse_matrix import WRITE_BUFFER_SIZE, SparseMatrix
+
+OPERATIONS = ("add", "subtract", "multiply")
+DEFAULT_CACHE_NNZ = 50_000_000
+
+
+class MatrixCache:
+    def __init__(self, max_nnz=DEFAULT_CACHE_NNZ, workers=1, parse_cache=False):
+        self.max_nnz = max_nnz
+        self.workers = workers
+        self.parse_cache = parse_cache
+        self.total_nnz = 0
+        self.loads = 0
+        self.hits = 0
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def get(self, matrixFilePath):
+        key = os.path.abspath(matrixFilePath)
+
+        with self._lock:
+            matrix = self._entries.get(key)
+            if matrix is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return matrix
+
+            pending = self._pending.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._pending[key] = Future()
+            else:
+                self.hits += 1
+
+        if not owner:
+            return pending.result()
+
+        try:
+            matrix = SparseMatrix.load(matrixFilePath, workers=self.workers, parse_cache=self.parse_cache)
+        except BaseException as e:
+            with self._lock:
+                del self._pending[key]
+            pending.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._pending[key]
+            self.loads += 1
+            self._store(key, matrix)
+        pending.set_result(matrix)
+        return matrix
+
+    def _store(self, key, matrix):
+        self._entries[key] = matrix
+        self.total_nnz += len(matrix.matrix_data)
+
+        while self.total_nnz > self.max_nnz and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.total_nnz -= len(evicted.matrix_data)
+
+
+def load_manifest(manifestPath):
+    if not os.path.exists(manifestPath):
+        raise FileNotFoundError(f"Manifest file not found at: {manifestPath}")
+
+    with open(manifestPath, 'r', newline='') as f:
+        if manifestPath.lower().endswith(".csv"):
+            jobs = list(csv.DictReader(f))
+        else:
+            jobs = json.load(f)
+            if isinstance(jobs, dict):
+                jobs = jobs.get("jobs", [])
+
+    if not isinstance(jobs, list):
+        raise ValueError("Manifest must be a list of jobs or an object with a \"jobs\" list.")
+
+    for i, job in enumerate(jobs):
+        if not isinstance(job, dict):
+            raise ValueError(f"Manifest job {i} must be an object, not {job!r}.")
+        if job.get("operation") not in OPERATIONS:
+            raise ValueError(f"Manifest job {i} has an invalid operation: {job.get('operation')!r}.")
+        if not job.get("first_matrix") or not job.get("second_matrix"):
+            raise ValueError(f"Manifest job {i} must name first_matrix and second_matrix.")
+
+    return jobs
+
+
+def default_output_path(job, output_dir):
+    first_name = os.path.basename(job["first_matrix"]).split('.')[0]
+    second_name = os.path.basename(job["second_matrix"]).split('.')[0]
+    return os.path.join(output_dir, f"result_{job['operation']}_{first_name}_{second_name}.txt")
+
+
+def run_job(index, job, cache, output_dir):
+    report = {"job": index, "operation": job["operation"], "first_matrix": job["first_matrix"],
+              "second_matrix": job["second_matrix"]}
+
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+    start = time.perf_counter()
+
+    try:
+        matrix1 = cache.get(job["first_matrix"])
+        matrix2 = cache.get(job["second_matrix"])
+        result_matrix = getattr(matrix1, job["operation"])(matrix2)
+
+        output_path = job.get("output") or default_output_path(job, output_dir)
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        with open(output_path, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+            result_matrix.write_to(f)
+
+        report["status"] = "ok"
+        report["output"] = output_path
+        report["nnz"] = len(result_matrix.matrix_data)
+    except (OSError, ValueError) as e:
+        report["status"] = "error"
+        report["error"] = str(e)
+    except Exception as e:
+        report["status"] = "error"
+        report["error"] = f"An unexpected error occurred: {type(e).__name__}: {e}"
+
+    report["seconds"] = time.perf_counter() - start
+    if tracemalloc.is_tracing():
+        report["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+    return report
+
+
+def group_jobs(jobs):
+    parent = {}
+
+    def find(key):
+        while parent.setdefault(key, key) != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    for job in jobs:
+        parent[find(os.path.abspath(job["first_matrix"]))] = find(os.path.abspath(job["second_matrix"]))
+
+    groups = {}
+    for index, job in enumerate(jobs):
+        groups.setdefault(find(os.path.abspath(job["first_matrix"])), []).append((index, job))
+    return sorted(groups.values(), key=len, reverse=True)
+
+
+def run_group(items, output_dir, max_cache_nnz=DEFAULT_CACHE_NNZ, parse_workers=1, parse_cache=False,
+              trace_memory=False):
+    cache = MatrixCache(max_cache_nnz, parse_workers, parse_cache)
+
+    started = trace_memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        reports = [run_job(index, job, cache, output_dir) for index, job in items]
+    finally:
+        if started:
+            tracemalloc.stop()
+
+    return reports, cache.loads, cache.hits
+
+
+def run_manifest(jobs, output_dir, workers=1, max_cache_nnz=DEFAULT_CACHE_NNZ, parse_workers=1,
+                 parse_cache=False):
+    trace_memory = tracemalloc.is_tracing()
+
+    if workers == 1:
+        results = [run_group(list(enumerate(jobs)), output_dir, max_cache_nnz, parse_workers, parse_cache)]
+    else:
+        groups = group_jobs(jobs)
+        with ProcessPoolExecutor(max_workers=min(workers, len(groups)) or 1) as pool:
+            results = list(pool.map(run_group, groups, [output_dir] * len(groups), [max_cache_nnz] * len(groups),
+                                    [parse_workers] * len(groups), [parse_cache] * len(groups),
+                                    [trace_memory] * len(groups)))
+
+    reports = sorted((report for group_reports, _, _ in results for report in group_reports),
+                     key=lambda report: report["job"])
+    return {"jobs": reports, "matrices_loaded": sum(loads for _, loads, _ in results),
+            "cache_hits": sum(hits for _, _, hits in results)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="batch_runner.py",
+                                     description="Run a manifest of sparse matrix jobs with a shared matrix cache.")
+    parser.add_argument("manifest", help="JSON list of jobs, or a CSV file with the same column names")
+    parser.add_argument("--output-dir", default=os.path.join("dsa", "sparse_matrix", "output"),
+                        help="directory for jobs that do not name an output file")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes running jobs; jobs that share an input file run in the same process")
+    parser.add_argument("--parse-workers", type=int, default=1, help="processes used to parse each input file")
+    parser.add_argument("--cache-nnz", type=int, default=DEFAULT_CACHE_NNZ,
+                        help="total nonzeros kept in each process's matrix cache")
+    parser.add_argument("--parse-cache", action="store_true",
+                        help="reuse a binary sidecar of each parsed text input while the input is unchanged")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="record each job's tracemalloc peak; slows jobs down several times")
+    parser.add_argument("--report", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    if args.workers < 1 or args.parse_workers < 1:
+        parser.error("--workers and --parse-workers must be at least 1")
+
+    try:
+        jobs = load_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.trace_memory:
+        tracemalloc.start()
+    try:
+        summary = run_manifest(jobs, args.output_dir, args.workers, args.cache_nnz, args.parse_workers,
+                               args.parse_cache)
+    finally:
+        if args.trace_memory:
+            tracemalloc.stop()
+
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(summary, f, indent=2)
+    else:
+        json.dump(summary, sys.stdout, indent=2)
+        print()
+
+    return 0 if all(report["status"] == "ok" for report in summary["jobs"]) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from matrix_generator import generate_entries, generate_values, write_matrix
+from sparse_matrix import WRITE_BUFFER_SIZE, SparseMatrix
+
+OPERATIONS = ("load", "add", "subtract", "multiply", "to_string")
+VALUE_RANGE = 9
+POWER_LAW_EXPONENT = 1.2
+
+DISTRIBUTIONS = {
+    "uniform": ("uniform", 0.0),
+    "power_law": ("uniform", POWER_LAW_EXPONENT),
+    "banded": ("banded", 0.0),
+    "block_diagonal": ("block_diagonal", 0.0),
+}
+
+
+def generator_options(distribution, numRows, numCols, nnz, seed=0):
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution: {distribution!r}.")
+
+    pattern, skew = DISTRIBUTIONS[distribution]
+    return {"numRows": numRows, "numCols": numCols, "nnz": nnz, "skew": skew, "seed": seed, "pattern": pattern}
+
+
+def generate_matrix(distribution, numRows, numCols, nnz, seed=0):
+    options = generator_options(distribution, numRows, numCols, nnz, seed)
+    matrix = SparseMatrix(numRows=numRows, numCols=numCols)
+    entries = generate_values(generate_entries(**options), -VALUE_RANGE, VALUE_RANGE, seed)
+    matrix.matrix_data = {(r, c): val for r, c, val in entries}
+    return matrix
+
+
+def time_operation(func, warmup, repeat):
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+
+    return {"min": min(samples), "median": statistics.median(samples), "mean": statistics.fmean(samples),
+            "samples": samples}
+
+
+def peak_memory(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark_case(distribution, size, nnz, operations, warmup, repeat, seed, work_dir):
+    matrix1 = generate_matrix(distribution, size, size, nnz, seed)
+    matrix2 = generate_matrix(distribution, size, size, nnz, seed + 1)
+
+    path = os.path.join(work_dir, f"{distribution}_{size}_{nnz}.txt")
+    with open(path, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+        write_matrix(f, min_value=-VALUE_RANGE, max_value=VALUE_RANGE,
+                     **generator_options(distribution, size, size, nnz, seed))
+
+    funcs = {
+        "load": lambda: SparseMatrix(matrixFilePath=path),
+        "add": lambda: matrix1.add(matrix2),
+        "subtract": lambda: matrix1.subtract(matrix2),
+        "multiply": lambda: matrix1.multiply(matrix2),
+        "to_string": matrix1.to_string,
+    }
+
+    results = []
+    for operation in operations:
+        results.append({"distribution": distribution, "rows": size, "cols": size, "nnz": len(matrix1.matrix_data),
+                        "operation": operation, "seconds": time_operation(funcs[operation], warmup, repeat),
+                        "peak_memory_bytes": peak_memory(funcs[operation])})
+    os.remove(path)
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(distributions, sizes, nnzs, operations, warmup=1, repeat=5, seed=0):
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for distribution in distributions:
+            for size in sizes:
+                for nnz in nnzs:
+                    results.extend(benchmark_case(distribution, size, nnz, operations, warmup, repeat, seed,
+                                                  work_dir))
+
+    return {"commit": git_commit(), "python": platform.python_version(), "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"), "warmup": warmup, "repeat": repeat, "seed": seed,
+            "results": results}
+
+
+def _case_key(result):
+    return (result["distribution"], result["rows"], result["cols"], result["nnz"], result["operation"])
+
+
+def compare(baseline, current, file_obj=sys.stdout):
+    baseline_results = {_case_key(result): result for result in baseline["results"]}
+
+    file_obj.write(f"baseline {baseline.get('commit')} -> current {current.get('commit')}\n")
+    for result in current["results"]:
+        old = baseline_results.get(_case_key(result))
+        if old is None:
+            continue
+        ratio = result["seconds"]["median"] / old["seconds"]["median"] if old["seconds"]["median"] else float("inf")
+        memory_ratio = (result["peak_memory_bytes"] / old["peak_memory_bytes"]
+                        if old["peak_memory_bytes"] else float("inf"))
+        file_obj.write(f"{result['distribution']:>14} {result['rows']:>8} {result['nnz']:>9} "
+                       f"{result['operation']:>9}  time x{ratio:.2f}  memory x{memory_ratio:.2f}\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="benchmark.py",
+                                     description="Time SparseMatrix operations on synthetic matrices.")
+    parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS, default=list(DISTRIBUTIONS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10_000], help="rows (and cols) of each matrix")
+    parser.add_argument("--nnz", nargs="+", type=int, default=[100_000], help="entries generated per matrix")
+    parser.add_argument("--operations", nargs="+", choices=OPERATIONS, default=list(OPERATIONS))
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs before measuring")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per operation")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="write the JSON results here instead of stdout")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare against")
+    args = parser.parse_args(argv)
+
+    if args.repeat < 1 or args.warmup < 0:
+        parser.error("--repeat must be at least 1 and --warmup must not be negative")
+    if min(args.sizes) < 1 or min(args.nnz) < 0:
+        parser.error("--sizes must be positive and --nnz must not be negative")
+
+    summary = run_benchmarks(args.distributions, args.sizes, args.nnz, args.operations, args.warmup, args.repeat,
+                             args.seed)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(summary, f, indent=2)
+    else:
+        json.dump(summary, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        try:
+            with open(args.compare, 'r') as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        compare(baseline, summary, sys.stderr if not args.output else sys.stdout)
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
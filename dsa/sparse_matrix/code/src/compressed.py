@@ -0,0 +1,718 @@
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from itertools import islice
+from operator import lt, mul
+
+np = None
+_numpy_checked = False
+
+BINARY_MAGIC = b"SPMX"
+BINARY_VERSION = 1
+BINARY_DTYPE = b"i8"
+BINARY_HEADER = struct.Struct("<4sIqqq2sB")
+BINARY_HEADER_SIZE = 64
+
+ORDER_UNSORTED = 0
+ORDER_ROW_MAJOR = 1
+
+DENSE_BLOCK_ROWS = 128
+
+
+class COOMatrix:
+    def __init__(self, numRows, numCols, row_indices, col_indices, data, row_sorted=False):
+        if numRows <= 0 or numCols <= 0:
+            raise ValueError("For an empty matrix, numRows and numCols must be positive.")
+        if not (len(row_indices) == len(col_indices) == len(data)):
+            raise ValueError("COO buffers must have the same length.")
+
+        self.rows = numRows
+        self.cols = numCols
+        self.row_indices = row_indices
+        self.col_indices = col_indices
+        self.data = data
+        self.row_sorted = row_sorted
+
+    def nnz(self):
+        return len(self.data)
+
+    def to_dict(self):
+        return dict(zip(zip(self.row_indices.tolist(), self.col_indices.tolist()), self.data.tolist()))
+
+    def save_binary(self, path):
+        order = ORDER_ROW_MAJOR if self.row_sorted else ORDER_UNSORTED
+        header = BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, self.rows, self.cols, self.nnz(), BINARY_DTYPE, order)
+
+        with open(path, 'wb') as f:
+            f.write(header.ljust(BINARY_HEADER_SIZE, b"\0"))
+            for buffer in (self.row_indices, self.col_indices, self.data):
+                f.write(_little_endian_bytes(buffer))
+
+    @classmethod
+    def load_binary(cls, path, use_mmap=False):
+        with open(path, 'rb') as f:
+            header = f.read(BINARY_HEADER_SIZE)
+            if len(header) < BINARY_HEADER_SIZE or not header.startswith(BINARY_MAGIC):
+                raise ValueError("Binary matrix file has wrong format: Missing header.")
+
+            _, version, numRows, numCols, nnz, dtype, order = BINARY_HEADER.unpack_from(header)
+            if version != BINARY_VERSION or dtype != BINARY_DTYPE:
+                raise ValueError(f"Binary matrix file has unsupported version {version} or dtype {dtype!r}.")
+            if os.fstat(f.fileno()).st_size != BINARY_HEADER_SIZE + 3 * 8 * nnz:
+                raise ValueError("Binary matrix file has wrong format: Size does not match the header.")
+
+            if load_numpy() is not None and use_mmap and nnz > 0:
+                buffers = np.memmap(path, dtype='<i8', mode='r', offset=BINARY_HEADER_SIZE, shape=(3, nnz))
+            elif np is not None:
+                buffers = np.fromfile(f, dtype='<i8', count=3 * nnz).reshape(3, nnz)
+            else:
+                buffers = []
+                for _ in range(3):
+                    buffer = array('q')
+                    buffer.frombytes(f.read(8 * nnz))
+                    if sys.byteorder == 'big':
+                        buffer.byteswap()
+                    buffers.append(buffer)
+
+        if nnz > 0 and (_unsigned_max(buffers[0]) >= numRows or _unsigned_max(buffers[1]) >= numCols):
+            raise ValueError(f"Binary matrix file has wrong format: Entry out of bounds for matrix "
+                             f"dimensions {numRows}x{numCols}.")
+        if nnz > 0 and not _all_nonzero(buffers[2]):
+            raise ValueError("Binary matrix file has wrong format: Entry with a zero value.")
+        if order == ORDER_ROW_MAJOR and not _is_row_major(buffers[0], buffers[1]):
+            raise ValueError("Binary matrix file has wrong format: Entries are not in the row-major order "
+                             "given by the header.")
+
+        return cls(numRows, numCols, buffers[0], buffers[1], buffers[2], order == ORDER_ROW_MAJOR)
+
+    def to_csr(self):
+        if self.row_sorted:
+            return self._sorted_to_csr()
+        if not _is_ndarray(self.data):
+            return CSRMatrix.from_dict(self.rows, self.cols, self.to_dict())
+
+        order = np.lexsort((self.col_indices, self.row_indices))
+        rows = self.row_indices[order]
+        cols = self.col_indices[order]
+        data = self.data[order]
+
+        last = np.ones(len(order), dtype=bool)
+        last[:-1] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+        rows, cols, data = rows[last], cols[last], data[last]
+
+        indptr = np.zeros(self.rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=self.rows), out=indptr[1:])
+        return CSRMatrix(self.rows, self.cols, _to_buffer(indptr), _to_buffer(cols), _to_buffer(data))
+
+    def _sorted_to_csr(self):
+        if _is_ndarray(self.data):
+            indptr = np.zeros(self.rows + 1, dtype=np.int64)
+            np.cumsum(np.bincount(self.row_indices, minlength=self.rows), out=indptr[1:])
+            return CSRMatrix(self.rows, self.cols, _to_buffer(indptr), _to_buffer(self.col_indices),
+                             _to_buffer(self.data))
+
+        indptr = array('q', [0]) * (self.rows + 1)
+        for r in self.row_indices:
+            indptr[r + 1] += 1
+        for r in range(self.rows):
+            indptr[r + 1] += indptr[r]
+        return CSRMatrix(self.rows, self.cols, indptr, self.col_indices[:], self.data[:])
+
+
+class CSRMatrix:
+    def __init__(self, numRows, numCols, indptr=None, indices=None, data=None):
+        if numRows <= 0 or numCols <= 0:
+            raise ValueError("For an empty matrix, numRows and numCols must be positive.")
+
+        self.rows = numRows
+        self.cols = numCols
+        self.indptr = indptr if indptr is not None else array('q', [0]) * (numRows + 1)
+        self.indices = indices if indices is not None else array('q')
+        self.data = data if data is not None else array('q')
+
+        if len(self.indptr) != numRows + 1 or len(self.indices) != len(self.data):
+            raise ValueError("CSR buffers do not match the matrix dimensions.")
+
+    @classmethod
+    def from_dict(cls, numRows, numCols, matrix_data):
+        indptr = array('q', [0]) * (numRows + 1)
+        indices = array('q')
+        data = array('q')
+
+        for (r, c), val in sorted(matrix_data.items()):
+            indptr[r + 1] += 1
+            indices.append(c)
+            data.append(val)
+
+        for r in range(numRows):
+            indptr[r + 1] += indptr[r]
+
+        return cls(numRows, numCols, indptr, indices, data)
+
+    def to_dict(self):
+        matrix_data = {}
+        indptr, indices, data = self.indptr, self.indices, self.data
+        for r in range(self.rows):
+            for i in range(indptr[r], indptr[r + 1]):
+                matrix_data[(r, indices[i])] = data[i]
+        return matrix_data
+
+    def nnz(self):
+        return len(self.data)
+
+    def _check_bounds(self, currRow, currCol):
+        if not (0 <= currRow < self.rows and 0 <= currCol < self.cols):
+            raise IndexError(f"({currRow}, {currCol}) is out of bounds for matrix of size ({self.rows}, {self.cols})")
+
+    def getElement(self, currRow, currCol):
+        self._check_bounds(currRow, currCol)
+        end = self.indptr[currRow + 1]
+        i = bisect_left(self.indices, currCol, self.indptr[currRow], end)
+        if i < end and self.indices[i] == currCol:
+            return self.data[i]
+        return 0
+
+    def setElement(self, currRow, currCol, value):
+        self._check_bounds(currRow, currCol)
+        end = self.indptr[currRow + 1]
+        i = bisect_left(self.indices, currCol, self.indptr[currRow], end)
+
+        if i < end and self.indices[i] == currCol:
+            if value != 0:
+                self.data[i] = value
+                return
+            del self.indices[i]
+            del self.data[i]
+            shift = -1
+        elif value != 0:
+            self.indices.insert(i, currCol)
+            self.data.insert(i, value)
+            shift = 1
+        else:
+            return
+
+        indptr = self.indptr
+        for r in range(currRow + 1, self.rows + 1):
+            indptr[r] += shift
+
+    def add(self, other_matrix):
+        if self.rows != other_matrix.rows or self.cols != other_matrix.cols:
+            raise ValueError("Matrix dimensions must match for addition.")
+        return self._merge(other_matrix, 1)
+
+    def subtract(self, other_matrix):
+        if self.rows != other_matrix.rows or self.cols != other_matrix.cols:
+            raise ValueError("Matrix dimensions must match for subtraction.")
+        return self._merge(other_matrix, -1)
+
+    def _merge(self, other_matrix, sign):
+        a_ptr, a_idx, a_val = self.indptr, self.indices, self.data
+        b_ptr, b_idx, b_val = other_matrix.indptr, other_matrix.indices, other_matrix.data
+
+        indptr = array('q', [0]) * (self.rows + 1)
+        indices = array('q')
+        data = array('q')
+
+        for r in range(self.rows):
+            i, i_end = a_ptr[r], a_ptr[r + 1]
+            j, j_end = b_ptr[r], b_ptr[r + 1]
+
+            while i < i_end and j < j_end:
+                ca, cb = a_idx[i], b_idx[j]
+                if ca < cb:
+                    indices.append(ca)
+                    data.append(a_val[i])
+                    i += 1
+                elif cb < ca:
+                    indices.append(cb)
+                    data.append(sign * b_val[j])
+                    j += 1
+                else:
+                    total = a_val[i] + sign * b_val[j]
+                    if total != 0:
+                        indices.append(ca)
+                        data.append(total)
+                    i += 1
+                    j += 1
+
+            indices.extend(a_idx[i:i_end])
+            data.extend(a_val[i:i_end])
+            indices.extend(b_idx[j:j_end])
+            if sign > 0:
+                data.extend(b_val[j:j_end])
+            else:
+                data.extend(-val for val in b_val[j:j_end])
+
+            indptr[r + 1] = len(data)
+
+        return CSRMatrix(self.rows, self.cols, indptr, indices, data)
+
+    def multiply(self, other_matrix, workers=1):
+        if self.cols != other_matrix.rows:
+            raise ValueError("Number of columns in the first matrix must equal "
+                             "number of rows in the second matrix for multiplication.")
+
+        try:
+            return self._multiply(other_matrix, workers)
+        except OverflowError:
+            raise _product_overflow_error() from None
+
+    def _multiply(self, other_matrix, workers):
+        if workers > 1 and self.rows > 1:
+            return self._multiply_parallel(other_matrix, workers)
+
+        row_counts, indices, data = _multiply_rows(self.indptr, self.indices, self.data, 0, self.rows,
+                                                   other_matrix.indptr, other_matrix.indices, other_matrix.data)
+        return CSRMatrix(self.rows, other_matrix.cols, _counts_to_indptr(row_counts), indices, data)
+
+    def multiply_symbolic(self, other_matrix):
+        if self.cols != other_matrix.rows:
+            raise ValueError("Number of columns in the first matrix must equal "
+                             "number of rows in the second matrix for multiplication.")
+
+        indptr, indices = _multiply_symbolic_rows(self.indptr, self.indices, self.rows,
+                                                  other_matrix.indptr, other_matrix.indices, other_matrix.cols)
+        return SymbolicProduct(self, other_matrix, indptr, indices)
+
+    def multiply_numeric(self, other_matrix, symbolic):
+        if not symbolic.matches(self, other_matrix):
+            raise ValueError("Symbolic product was computed for operands with a different sparsity pattern.")
+
+        try:
+            data = _multiply_numeric_rows(self.indptr, self.indices, self.data, self.rows,
+                                          other_matrix.indptr, other_matrix.indices, other_matrix.data,
+                                          symbolic.indptr, symbolic.indices, symbolic.cols)
+        except OverflowError:
+            raise _product_overflow_error() from None
+
+        if 0 not in data:
+            return CSRMatrix(symbolic.rows, symbolic.cols, symbolic.indptr[:], symbolic.indices[:], data)
+        return _drop_zeros(symbolic.rows, symbolic.cols, symbolic.indptr, symbolic.indices, data)
+
+    def _multiply_parallel(self, other_matrix, workers):
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing.shared_memory import SharedMemory
+
+        buffers = (self.indptr, self.indices, self.data, other_matrix.indptr, other_matrix.indices, other_matrix.data)
+        lengths = [len(buffer) for buffer in buffers]
+
+        shared = SharedMemory(create=True, size=max(8 * sum(lengths), 8))
+        try:
+            offset = 0
+            for buffer in buffers:
+                size = 8 * len(buffer)
+                shared.buf[offset:offset + size] = buffer.tobytes()
+                offset += size
+
+            nnz = len(self.data)
+            boundaries = [0]
+            for i in range(1, workers):
+                boundary = bisect_left(self.indptr, nnz * i // workers, boundaries[-1], self.rows)
+                if boundary > boundaries[-1]:
+                    boundaries.append(boundary)
+            boundaries.append(self.rows)
+
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                blocks = pool.map(_multiply_shared_rows, [shared.name] * (len(boundaries) - 1),
+                                  [lengths] * (len(boundaries) - 1), boundaries, boundaries[1:])
+
+                row_counts, indices, data = array('q'), array('q'), array('q')
+                for block_counts, block_indices, block_data in blocks:
+                    row_counts.extend(block_counts)
+                    indices.extend(block_indices)
+                    data.extend(block_data)
+        finally:
+            shared.close()
+            shared.unlink()
+
+        return CSRMatrix(self.rows, other_matrix.cols, _counts_to_indptr(row_counts), indices, data)
+
+    def matvec(self, x):
+        if len(x) != self.cols:
+            raise ValueError("Vector length must equal the number of columns in the matrix for multiplication.")
+
+        if _is_ndarray(x):
+            if x.ndim == 2:
+                return self.multiply_dense(x)
+            indptr, indices, data = self._numpy_buffers()
+            row_ids = np.repeat(np.arange(self.rows), np.diff(indptr))
+            result = np.zeros(self.rows, dtype=np.result_type(data, x))
+            np.add.at(result, row_ids, data * x[indices])
+            return result
+
+        if _is_block(x):
+            return self.multiply_dense(x)
+
+        indptr, indices, data = self.indptr, self.indices, self.data
+        lookup = x.__getitem__
+        result = [0] * self.rows
+        for r in range(self.rows):
+            start, end = indptr[r], indptr[r + 1]
+            if start != end:
+                result[r] = sum(map(mul, data[start:end], map(lookup, indices[start:end])))
+        return result
+
+    def multiply_dense(self, dense_matrix, block_rows=DENSE_BLOCK_ROWS):
+        if len(dense_matrix) != self.cols:
+            raise ValueError("Number of columns in the first matrix must equal "
+                             "number of rows in the second matrix for multiplication.")
+
+        if _is_ndarray(dense_matrix):
+            return self._multiply_dense_numpy(dense_matrix, block_rows)
+
+        indptr, indices, data = self.indptr, self.indices, self.data
+        width = len(dense_matrix[0]) if dense_matrix else 0
+        result = []
+        for r in range(self.rows):
+            row_sums = [0] * width
+            for i in range(indptr[r], indptr[r + 1]):
+                val = data[i]
+                row_sums = [total + val * entry for total, entry in zip(row_sums, dense_matrix[indices[i]])]
+            result.append(row_sums)
+        return result
+
+    def _multiply_dense_numpy(self, dense_matrix, block_rows):
+        indptr, indices, data = self._numpy_buffers()
+        result = np.zeros((self.rows, dense_matrix.shape[1]), dtype=np.result_type(data, dense_matrix))
+
+        for first in range(0, self.rows, block_rows):
+            last = min(first + block_rows, self.rows)
+            start, end = indptr[first], indptr[last]
+            if start == end:
+                continue
+
+            row_starts = indptr[first:last]
+            nonempty = np.flatnonzero(indptr[first + 1:last + 1] != row_starts)
+            products = data[start:end, None] * dense_matrix[indices[start:end]]
+            result[first + nonempty] = np.add.reduceat(products, row_starts[nonempty] - start, axis=0)
+
+        return result
+
+    def rmatvec(self, x):
+        if len(x) != self.rows:
+            raise ValueError("Vector length must equal the number of rows in the matrix for multiplication.")
+
+        if _is_ndarray(x):
+            indptr, indices, data = self._numpy_buffers()
+            row_ids = np.repeat(np.arange(self.rows), np.diff(indptr))
+            products = data.reshape((-1,) + (1,) * (x.ndim - 1)) * x[row_ids]
+            result = np.zeros((self.cols,) + x.shape[1:], dtype=products.dtype)
+            np.add.at(result, indices, products)
+            return result
+
+        indptr, indices, data = self.indptr, self.indices, self.data
+        if _is_block(x):
+            width = len(x[0])
+            result = [[0] * width for _ in range(self.cols)]
+            for r in range(self.rows):
+                x_row = x[r]
+                for i in range(indptr[r], indptr[r + 1]):
+                    c, val = indices[i], data[i]
+                    result[c] = [total + val * entry for total, entry in zip(result[c], x_row)]
+            return result
+
+        result = [0] * self.cols
+        for r in range(self.rows):
+            x_val = x[r]
+            if x_val:
+                for i in range(indptr[r], indptr[r + 1]):
+                    result[indices[i]] += data[i] * x_val
+        return result
+
+    def _numpy_buffers(self):
+        return (np.frombuffer(self.indptr, dtype=np.int64), np.frombuffer(self.indices, dtype=np.int64),
+                np.frombuffer(self.data, dtype=np.int64))
+
+    def iter_lines(self):
+        yield f"rows={self.rows}\n"
+        yield f"cols={self.cols}\n"
+        indptr, indices, data = self.indptr, self.indices, self.data
+        for r in range(self.rows):
+            for i in range(indptr[r], indptr[r + 1]):
+                yield f"({r}, {indices[i]}, {data[i]})\n"
+
+    def write_to(self, file_obj):
+        file_obj.writelines(self.iter_lines())
+
+    def to_string(self):
+        return "".join(self.iter_lines())
+
+    def to_csc(self):
+        colptr, row_indices, data = _compress_transpose(self.rows, self.cols, self.indptr, self.indices, self.data)
+        return CSCMatrix(self.rows, self.cols, colptr, row_indices, data)
+
+    def transpose(self):
+        indptr, indices, data = _compress_transpose(self.rows, self.cols, self.indptr, self.indices, self.data)
+        return CSRMatrix(self.cols, self.rows, indptr, indices, data)
+
+    def transpose_view(self):
+        return CSCMatrix(self.cols, self.rows, self.indptr, self.indices, self.data)
+
+
+class SymbolicProduct:
+    def __init__(self, left_matrix, right_matrix, indptr, indices):
+        self.rows = left_matrix.rows
+        self.cols = right_matrix.cols
+        self.indptr = indptr
+        self.indices = indices
+        self._left_pattern = (left_matrix.rows, left_matrix.cols, left_matrix.indptr[:], left_matrix.indices[:])
+        self._right_pattern = (right_matrix.rows, right_matrix.cols, right_matrix.indptr[:], right_matrix.indices[:])
+
+    def nnz(self):
+        return len(self.indices)
+
+    def matches(self, left_matrix, right_matrix):
+        return (self._left_pattern == (left_matrix.rows, left_matrix.cols, left_matrix.indptr, left_matrix.indices)
+                and self._right_pattern == (right_matrix.rows, right_matrix.cols, right_matrix.indptr,
+                                            right_matrix.indices))
+
+
+class CSCMatrix:
+    def __init__(self, numRows, numCols, indptr=None, indices=None, data=None):
+        if numRows <= 0 or numCols <= 0:
+            raise ValueError("For an empty matrix, numRows and numCols must be positive.")
+
+        self.rows = numRows
+        self.cols = numCols
+        self.indptr = indptr if indptr is not None else array('q', [0]) * (numCols + 1)
+        self.indices = indices if indices is not None else array('q')
+        self.data = data if data is not None else array('q')
+
+        if len(self.indptr) != numCols + 1 or len(self.indices) != len(self.data):
+            raise ValueError("CSC buffers do not match the matrix dimensions.")
+
+    @classmethod
+    def from_dict(cls, numRows, numCols, matrix_data):
+        indptr = array('q', [0]) * (numCols + 1)
+        indices = array('q')
+        data = array('q')
+
+        for (c, r), val in sorted(((c, r), val) for (r, c), val in matrix_data.items()):
+            indptr[c + 1] += 1
+            indices.append(r)
+            data.append(val)
+
+        for c in range(numCols):
+            indptr[c + 1] += indptr[c]
+
+        return cls(numRows, numCols, indptr, indices, data)
+
+    def to_dict(self):
+        matrix_data = {}
+        indptr, indices, data = self.indptr, self.indices, self.data
+        for c in range(self.cols):
+            for i in range(indptr[c], indptr[c + 1]):
+                matrix_data[(indices[i], c)] = data[i]
+        return matrix_data
+
+    def to_csr(self):
+        indptr, col_indices, data = _compress_transpose(self.cols, self.rows, self.indptr, self.indices, self.data)
+        return CSRMatrix(self.rows, self.cols, indptr, col_indices, data)
+
+    def transpose_view(self):
+        return CSRMatrix(self.cols, self.rows, self.indptr, self.indices, self.data)
+
+    def nnz(self):
+        return len(self.data)
+
+    def getElement(self, currRow, currCol):
+        if not (0 <= currRow < self.rows and 0 <= currCol < self.cols):
+            raise IndexError(f"({currRow}, {currCol}) is out of bounds for matrix of size ({self.rows}, {self.cols})")
+        end = self.indptr[currCol + 1]
+        i = bisect_left(self.indices, currRow, self.indptr[currCol], end)
+        if i < end and self.indices[i] == currRow:
+            return self.data[i]
+        return 0
+
+    def column_sums(self):
+        indptr, data = self.indptr, self.data
+        return [sum(data[indptr[c]:indptr[c + 1]]) for c in range(self.cols)]
+
+
+def _compress_transpose(numMajor, numMinor, indptr, indices, data):
+    counts = array('q', [0]) * (numMinor + 1)
+    for minor in indices:
+        counts[minor + 1] += 1
+    for m in range(numMinor):
+        counts[m + 1] += counts[m]
+
+    out_indptr = array('q', counts)
+    out_indices = array('q', [0]) * len(indices)
+    out_data = array('q', [0]) * len(data)
+    next_slot = counts
+
+    for major in range(numMajor):
+        for i in range(indptr[major], indptr[major + 1]):
+            minor = indices[i]
+            slot = next_slot[minor]
+            out_indices[slot] = major
+            out_data[slot] = data[i]
+            next_slot[minor] = slot + 1
+
+    return out_indptr, out_indices, out_data
+
+
+def _multiply_rows(a_ptr, a_idx, a_val, row_start, row_end, b_ptr, b_idx, b_val):
+    row_counts = array('q', [0]) * (row_end - row_start)
+    indices = array('q')
+    data = array('q')
+
+    for r in range(row_start, row_end):
+        row_sums = {}
+        for i in range(a_ptr[r], a_ptr[r + 1]):
+            k, val1 = a_idx[i], a_val[i]
+            for j in range(b_ptr[k], b_ptr[k + 1]):
+                c = b_idx[j]
+                row_sums[c] = row_sums.get(c, 0) + val1 * b_val[j]
+
+        before = len(data)
+        for c in sorted(row_sums):
+            total = row_sums[c]
+            if total != 0:
+                indices.append(c)
+                data.append(total)
+        row_counts[r - row_start] = len(data) - before
+
+    return row_counts, indices, data
+
+
+def _product_overflow_error():
+    return ValueError("Product has an entry that does not fit in a 64-bit integer; "
+                      "multiply the dictionary form instead.")
+
+
+def _multiply_symbolic_rows(a_ptr, a_idx, numRows, b_ptr, b_idx, numCols):
+    indptr = array('q', [0]) * (numRows + 1)
+    indices = array('q')
+    last_row = array('q', [-1]) * numCols
+
+    for r in range(numRows):
+        row_cols = []
+        for i in range(a_ptr[r], a_ptr[r + 1]):
+            k = a_idx[i]
+            for j in range(b_ptr[k], b_ptr[k + 1]):
+                c = b_idx[j]
+                if last_row[c] != r:
+                    last_row[c] = r
+                    row_cols.append(c)
+
+        row_cols.sort()
+        indices.extend(row_cols)
+        indptr[r + 1] = len(indices)
+
+    return indptr, indices
+
+
+def _multiply_numeric_rows(a_ptr, a_idx, a_val, numRows, b_ptr, b_idx, b_val, indptr, indices, numCols):
+    data = array('q', bytes(8 * len(indices)))
+    slot = array('q', [0]) * numCols
+
+    for r in range(numRows):
+        for p in range(indptr[r], indptr[r + 1]):
+            slot[indices[p]] = p
+
+        for i in range(a_ptr[r], a_ptr[r + 1]):
+            k, val1 = a_idx[i], a_val[i]
+            for j in range(b_ptr[k], b_ptr[k + 1]):
+                data[slot[b_idx[j]]] += val1 * b_val[j]
+
+    return data
+
+
+def _drop_zeros(numRows, numCols, indptr, indices, data):
+    kept_indptr = array('q', [0]) * (numRows + 1)
+    kept_indices = array('q')
+    kept_data = array('q')
+
+    for r in range(numRows):
+        for p in range(indptr[r], indptr[r + 1]):
+            if data[p] != 0:
+                kept_indices.append(indices[p])
+                kept_data.append(data[p])
+        kept_indptr[r + 1] = len(kept_data)
+
+    return CSRMatrix(numRows, numCols, kept_indptr, kept_indices, kept_data)
+
+
+def _multiply_shared_rows(shared_name, lengths, row_start, row_end):
+    from multiprocessing.shared_memory import SharedMemory
+
+    shared = SharedMemory(name=shared_name)
+    view = shared.buf.cast('q')
+    buffers = []
+    try:
+        offset = 0
+        for length in lengths:
+            buffers.append(view[offset:offset + length])
+            offset += length
+        return _multiply_rows(buffers[0], buffers[1], buffers[2], row_start, row_end,
+                              buffers[3], buffers[4], buffers[5])
+    finally:
+        for buffer in buffers:
+            buffer.release()
+        view.release()
+        shared.close()
+
+
+def _counts_to_indptr(row_counts):
+    indptr = array('q', [0]) * (len(row_counts) + 1)
+    total = 0
+    for r, count in enumerate(row_counts):
+        total += count
+        indptr[r + 1] = total
+    return indptr
+
+
+def load_numpy():
+    global np, _numpy_checked
+    if not _numpy_checked:
+        _numpy_checked = True
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+    return np
+
+
+def _is_ndarray(values):
+    return "numpy" in sys.modules and load_numpy() is not None and isinstance(values, np.ndarray)
+
+
+def _unsigned_max(buffer):
+    if _is_ndarray(buffer):
+        return int(buffer.view(np.uint64).max())
+    return max(memoryview(buffer).cast('B').cast('Q'))
+
+
+def _all_nonzero(buffer):
+    return bool(buffer.all()) if _is_ndarray(buffer) else all(buffer)
+
+
+def _is_row_major(rows, cols):
+    if _is_ndarray(rows):
+        same_row = rows[1:] == rows[:-1]
+        return bool(((rows[1:] > rows[:-1]) | (same_row & (cols[1:] > cols[:-1]))).all())
+    return all(map(lt, zip(rows, cols), zip(islice(rows, 1, None), islice(cols, 1, None))))
+
+
+def _is_block(x):
+    return len(x) > 0 and isinstance(x[0], (list, tuple, array))
+
+
+def _to_buffer(values):
+    buffer = array('q')
+    buffer.frombytes(values.astype(np.int64).tobytes())
+    return buffer
+
+
+def _little_endian_bytes(values):
+    if _is_ndarray(values):
+        return values.astype('<i8').tobytes()
+
+    buffer = values if isinstance(values, array) and values.typecode == 'q' else array('q', values)
+    if sys.byteorder == 'big':
+        buffer = array('q', buffer)
+        buffer.byteswap()
+    return buffer.tobytes()
@@ -0,0 +1,196 @@
+import argparse
+import random
+import sys
+from array import array
+
+from sparse_matrix import WRITE_BUFFER_SIZE
+
+ORDERINGS = ("sorted", "shuffled")
+PATTERNS = ("uniform", "banded", "block_diagonal")
+DEFAULT_BLOCK_SIZE = 64
+SHUFFLE_WINDOW = 1 << 16
+LINE_BATCH = 1 << 14
+
+
+def column_windows(numRows, numCols, nnz, pattern="uniform", bandwidth=None, block_size=DEFAULT_BLOCK_SIZE):
+    if pattern not in PATTERNS:
+        raise ValueError(f"Unknown pattern: {pattern!r}.")
+
+    if pattern == "uniform":
+        return array('q', bytes(8 * numRows)), array('q', [numCols]) * numRows
+
+    starts, ends = array('q'), array('q')
+    if pattern == "banded":
+        half_width = bandwidth if bandwidth is not None else nnz // numRows + 1
+        for r in range(numRows):
+            center = r * numCols // numRows
+            starts.append(max(0, center - half_width))
+            ends.append(min(numCols, center + half_width + 1))
+    else:
+        blocks = max(1, min(numRows, numCols) // block_size)
+        for r in range(numRows):
+            b = r * blocks // numRows
+            starts.append(b * numCols // blocks)
+            ends.append((b + 1) * numCols // blocks)
+
+    return starts, ends
+
+
+def row_counts(starts, ends, nnz, skew=0.0):
+    numRows = len(starts)
+    capacity = sum(ends) - sum(starts)
+    if nnz > capacity:
+        raise ValueError(f"Cannot place {nnz} distinct entries in the {capacity} positions the pattern allows.")
+
+    total_weight = sum((i + 1) ** -skew for i in range(numRows))
+    counts = array('q', bytes(8 * numRows))
+    cumulative_weight = 0.0
+    placed = 0
+    for i in range(numRows):
+        cumulative_weight += (i + 1) ** -skew
+        target = min(nnz, round(nnz * cumulative_weight / total_weight))
+        counts[i] = target - placed
+        placed = target
+    counts[-1] += nnz - placed
+
+    overflow = 0
+    for i in range(numRows):
+        room = ends[i] - starts[i]
+        if counts[i] > room:
+            overflow += counts[i] - room
+            counts[i] = room
+    for i in range(numRows):
+        if not overflow:
+            break
+        extra = min(overflow, ends[i] - starts[i] - counts[i])
+        counts[i] += extra
+        overflow -= extra
+
+    return counts
+
+
+def _row_entries(rnd, starts, ends, counts, row_order):
+    for r in row_order:
+        k = counts[r]
+        if k:
+            for c in sorted(rnd.sample(range(starts[r], ends[r]), k)):
+                yield r, c
+
+
+def _ordered_entries(rnd, positions, ordering, duplicates):
+    window = []
+    for position in positions:
+        repeats = 1
+        while rnd.random() < duplicates:
+            repeats += 1
+
+        if ordering == "sorted":
+            for _ in range(repeats):
+                yield position
+            continue
+
+        window.extend([position] * repeats)
+        if len(window) >= SHUFFLE_WINDOW:
+            rnd.shuffle(window)
+            yield from window
+            window.clear()
+
+    rnd.shuffle(window)
+    yield from window
+
+
+def generate_entries(numRows, numCols, nnz, ordering="sorted", skew=0.0, duplicates=0.0, seed=0, pattern="uniform",
+                     bandwidth=None, block_size=DEFAULT_BLOCK_SIZE):
+    if ordering not in ORDERINGS:
+        raise ValueError(f"Unknown ordering: {ordering!r}.")
+    if not 0.0 <= duplicates < 1.0:
+        raise ValueError("Duplicate probability must be in [0, 1).")
+
+    rnd = random.Random(seed)
+    starts, ends = column_windows(numRows, numCols, nnz, pattern, bandwidth, block_size)
+    counts = row_counts(starts, ends, nnz, skew)
+    row_order = array('q', range(numRows))
+    if ordering == "shuffled":
+        rnd.shuffle(row_order)
+
+    return _ordered_entries(rnd, _row_entries(rnd, starts, ends, counts, row_order), ordering, duplicates)
+
+
+def _valued_entries(rnd, entries, min_value, span):
+    for r, c in entries:
+        val = 0
+        while val == 0:
+            val = min_value + int(rnd.random() * span)
+        yield r, c, val
+
+
+def generate_values(entries, min_value=-9, max_value=9, seed=0):
+    if min_value > max_value or min_value == max_value == 0:
+        raise ValueError("Value range must contain a nonzero value.")
+    return _valued_entries(random.Random(seed + 1), entries, min_value, max_value - min_value + 1)
+
+
+def write_matrix(file_obj, numRows, numCols, nnz, min_value=-9, max_value=9, ordering="sorted", skew=0.0,
+                 duplicates=0.0, seed=0, pattern="uniform", bandwidth=None, block_size=DEFAULT_BLOCK_SIZE):
+    entries = generate_values(generate_entries(numRows, numCols, nnz, ordering, skew, duplicates, seed, pattern,
+                                               bandwidth, block_size), min_value, max_value, seed)
+
+    file_obj.write(f"rows={numRows}\ncols={numCols}\n")
+    lines = []
+    written = 0
+    for r, c, val in entries:
+        lines.append(f"({r}, {c}, {val})\n")
+        if len(lines) >= LINE_BATCH:
+            file_obj.writelines(lines)
+            written += len(lines)
+            lines.clear()
+
+    file_obj.writelines(lines)
+    return written + len(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="matrix_generator.py",
+                                     description="Stream a synthetic sparse matrix in the sample_inputs text format.")
+    parser.add_argument("output", help="file to write, or - for stdout")
+    parser.add_argument("--rows", type=int, required=True)
+    parser.add_argument("--cols", type=int, required=True)
+    parser.add_argument("--nnz", type=int, required=True, help="distinct positions written")
+    parser.add_argument("--min-value", type=int, default=-9)
+    parser.add_argument("--max-value", type=int, default=9)
+    parser.add_argument("--ordering", choices=ORDERINGS, default="sorted",
+                        help="row-major order, or rows in random order with entries shuffled in windows")
+    parser.add_argument("--pattern", choices=PATTERNS, default="uniform",
+                        help="columns each row may use: any, a band around the diagonal, or its diagonal block")
+    parser.add_argument("--bandwidth", type=int,
+                        help="banded half-width in columns; defaults to nnz // rows + 1")
+    parser.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE, help="block_diagonal block size")
+    parser.add_argument("--skew", type=float, default=0.0,
+                        help="power-law exponent for entries per row; 0 is uniform, larger piles entries on top rows")
+    parser.add_argument("--duplicates", type=float, default=0.0,
+                        help="probability that an entry is repeated with a new value")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.rows < 1 or args.cols < 1 or args.nnz < 0:
+        parser.error("--rows and --cols must be positive and --nnz must not be negative")
+    if args.block_size < 1 or (args.bandwidth is not None and args.bandwidth < 0):
+        parser.error("--block-size must be positive and --bandwidth must not be negative")
+
+    options = (args.rows, args.cols, args.nnz, args.min_value, args.max_value, args.ordering, args.skew,
+               args.duplicates, args.seed, args.pattern, args.bandwidth, args.block_size)
+    try:
+        if args.output == "-":
+            lines = write_matrix(sys.stdout, *options)
+        else:
+            with open(args.output, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+                lines = write_matrix(f, *options)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Wrote {lines} entries.", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,31 @@
+import math
+import operator
+
+
+class Semiring:
+    def __init__(self, add, mul, zero, kind="custom", modulus=None):
+        self.add = add
+        self.mul = mul
+        self.zero = zero
+        self.kind = kind
+        self.modulus = modulus
+
+
+def _boolean_or(a, b):
+    return 1 if a or b else 0
+
+
+def _boolean_and(a, b):
+    return 1 if a and b else 0
+
+
+def modular_semiring(modulus):
+    if modulus <= 1:
+        raise ValueError("Modulus must be greater than 1.")
+    return Semiring(lambda a, b: (a + b) % modulus, lambda a, b: (a * b) % modulus, 0, "mod", modulus)
+
+
+PLUS_TIMES = Semiring(operator.add, operator.mul, 0, "plus_times")
+MIN_PLUS = Semiring(min, operator.add, math.inf, "min_plus")
+MAX_TIMES = Semiring(max, operator.mul, -math.inf, "max_times")
+OR_AND = Semiring(_boolean_or, _boolean_and, 0, "or_and")
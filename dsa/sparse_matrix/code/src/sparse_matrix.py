@@ -1,26 +1,285 @@
+import argparse
+import hashlib
+import io
+import json
+import mmap
 import os
+import re
+import sys
+from array import array
+from itertools import compress
+
+from compressed import BINARY_MAGIC, COOMatrix, CSCMatrix, CSRMatrix, load_numpy
+
+READ_BUFFER_SIZE = 1 << 20
+WRITE_BUFFER_SIZE = 1 << 20
+
+CACHE_SUFFIX = ".spmx"
+CACHE_KEY_SUFFIX = ".json"
+
+MAX_INT64_DIGITS = 18
+INT64_LIMIT = 1 << 63
+
+ENTRY_PATTERN = re.compile(rb"^[ \t]*\([ \t]*-?[0-9]+[ \t]*,[ \t]*-?[0-9]+[ \t]*,[ \t]*-?[0-9]+[ \t]*\)[ \t\r]*$",
+                           re.MULTILINE)
 
 class SparseMatrix:
-    def __init__(self, matrixFilePath=None, numRows=0, numCols=0):
+    def __init__(self, matrixFilePath=None, numRows=0, numCols=0, use_mmap=False, workers=1, parse_cache=False):
         self.rows = numRows
         self.cols = numCols
         self.matrix_data = {}
 
-        if matrixFilePath:
-            self._load_from_file(matrixFilePath)
+        if matrixFilePath and parse_cache:
+            self._load_with_cache(matrixFilePath, use_mmap, workers)
+        elif matrixFilePath:
+            self._load_from_file(matrixFilePath, use_mmap, workers)
         elif numRows <= 0 or numCols <= 0:
             raise ValueError("For an empty matrix, numRows and numCols must be positive.")
 
-    def _load_from_file(self, matrixFilePath):
+    def _load_from_file(self, matrixFilePath, use_mmap=False, workers=1):
+        matrix_data = self.matrix_data
+        for rows, cols, values in self._read_blocks(matrixFilePath, False, use_mmap, workers):
+            matrix_data.update(compress(zip(zip(rows, cols), values), values))
+
+    def _load_with_cache(self, matrixFilePath, use_mmap, workers):
+        if not os.path.exists(matrixFilePath):
+            raise FileNotFoundError(f"Matrix file not found at: {matrixFilePath}")
+
+        cache_path = matrixFilePath + CACHE_SUFFIX
+        key_path = cache_path + CACHE_KEY_SUFFIX
+        source = _source_key(matrixFilePath)
+        source["sha256"] = _file_digest(matrixFilePath)
+        cached = _read_cache_key(key_path)
+
+        if cached is not None and all(cached[field] == source[field] for field in ("path", "size", "sha256")):
+            try:
+                if _file_digest(cache_path) == cached["cache_sha256"]:
+                    coo_matrix = COOMatrix.load_binary(cache_path, use_mmap)
+                    self.rows = coo_matrix.rows
+                    self.cols = coo_matrix.cols
+                    self.matrix_data = coo_matrix.to_dict()
+                    return
+            except (OSError, ValueError):
+                pass
+
+        self._load_from_file(matrixFilePath, use_mmap, workers)
+
+        if _source_key(matrixFilePath) != {field: source[field] for field in ("path", "size", "mtime_ns")}:
+            return
+        try:
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            self.to_coo(row_sorted=False).save_binary(temp_path)
+            source["cache_sha256"] = _file_digest(temp_path)
+            os.replace(temp_path, cache_path)
+            _write_cache_key(key_path, source)
+        except (OSError, OverflowError):
+            pass
+
+    @classmethod
+    def load(cls, matrixFilePath, use_mmap=False, workers=1, parse_cache=False):
         if not os.path.exists(matrixFilePath):
             raise FileNotFoundError(f"Matrix file not found at: {matrixFilePath}")
 
-        with open(matrixFilePath, 'r') as f:
-            lines = f.readlines()
+        with open(matrixFilePath, 'rb') as f:
+            is_binary = f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+
+        if is_binary:
+            return cls.load_binary(matrixFilePath, use_mmap)
+        return cls(matrixFilePath=matrixFilePath, use_mmap=use_mmap, workers=workers, parse_cache=parse_cache)
+
+    @classmethod
+    def load_coo(cls, matrixFilePath, use_mmap=False, workers=1):
+        reader = cls(numRows=1, numCols=1)
+        use_numpy = load_numpy() is not None
+        row_indices, col_indices, data = reader._collect_coo(
+            reader._read_blocks(matrixFilePath, use_numpy, use_mmap, workers), use_numpy)
+        return COOMatrix(reader.rows, reader.cols, row_indices, col_indices, data)
+
+    def _collect_coo(self, blocks, use_numpy):
+        if not use_numpy:
+            row_indices, col_indices, data = array('q'), array('q'), array('q')
+            for rows, cols, values in blocks:
+                try:
+                    row_indices.extend(compress(rows, values))
+                    col_indices.extend(compress(cols, values))
+                    data.extend(compress(values, values))
+                except OverflowError:
+                    raise _int64_overflow_error(rows, cols, values) from None
+            return row_indices, col_indices, data
+
+        np = load_numpy()
+        row_blocks, col_blocks, value_blocks = [], [], []
+        for rows, cols, values in blocks:
+            nonzero = values != 0
+            row_blocks.append(rows[nonzero])
+            col_blocks.append(cols[nonzero])
+            value_blocks.append(values[nonzero])
+
+        if not value_blocks:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return np.concatenate(row_blocks), np.concatenate(col_blocks), np.concatenate(value_blocks)
+
+    def _read_blocks(self, matrixFilePath, use_numpy=False, use_mmap=False, workers=1):
+        if not os.path.exists(matrixFilePath):
+            raise FileNotFoundError(f"Matrix file not found at: {matrixFilePath}")
+
+        with open(matrixFilePath, 'rb', buffering=0) as f:
+            if workers > 1:
+                yield from self._parallel_blocks(matrixFilePath, f, use_numpy, workers)
+                return
+
+            if use_mmap and os.fstat(f.fileno()).st_size > 0:
+                chunks = self._mapped_chunks(f)
+            else:
+                chunks = self._buffered_chunks(f)
+
+            parse_block = self._parse_block_numpy if use_numpy else self._parse_block
+            for chunk in chunks:
+                yield parse_block(chunk)
+
+    def _parallel_blocks(self, matrixFilePath, f, use_numpy, workers):
+        self._read_dimensions(f.readline().decode(), f.readline().decode())
+
+        size = os.fstat(f.fileno()).st_size
+        boundaries = [f.tell()]
+        for i in range(1, workers):
+            f.seek(max(boundaries[0] + (size - boundaries[0]) * i // workers - 1, boundaries[-1]))
+            f.readline()
+            if f.tell() > boundaries[-1]:
+                boundaries.append(f.tell())
+        if size > boundaries[-1]:
+            boundaries.append(size)
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_parse_file_range, matrixFilePath, start, end, self.rows, self.cols, use_numpy)
+                       for start, end in zip(boundaries, boundaries[1:])]
+            try:
+                for future in futures:
+                    yield future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _buffered_chunks(self, f):
+        self._read_dimensions(f.readline().decode(), f.readline().decode())
+        yield from self._range_chunks(f, None)
+
+    def _range_chunks(self, f, end):
+        pending = b""
+        while True:
+            size = READ_BUFFER_SIZE if end is None else min(READ_BUFFER_SIZE, end - f.tell())
+            block = f.read(size) if size > 0 else b""
+            if not block:
+                break
+
+            cut = block.rfind(b"\n") + 1
+            if cut == 0:
+                pending += block
+                continue
+
+            yield pending + block[:cut]
+            pending = block[cut:]
+
+        if pending:
+            yield pending + b"\n"
+
+    def _mapped_chunks(self, f):
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mapped, "madvise"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+
+            size = len(mapped)
+            rows_end = mapped.find(b"\n") + 1 or size
+            cols_end = mapped.find(b"\n", rows_end) + 1 or size
+            self._read_dimensions(mapped[:rows_end].decode(), mapped[rows_end:cols_end].decode())
+
+            start = cols_end
+            while start < size:
+                cut = mapped.rfind(b"\n", start, start + READ_BUFFER_SIZE) + 1
+                if cut == 0:
+                    cut = mapped.find(b"\n", start + READ_BUFFER_SIZE) + 1 or size
+
+                chunk = mapped[start:cut]
+                yield chunk if chunk.endswith(b"\n") else chunk + b"\n"
+                start = cut
+
+    def _parse_block(self, chunk):
+        if ENTRY_PATTERN.subn(b"", chunk)[1] != chunk.count(b"\n"):
+            return self._parse_block_slow(chunk)
+
+        try:
+            numbers = json.loads(b"[" + chunk.translate(None, b"() \t\r").replace(b"\n", b",")[:-1] + b"]")
+        except ValueError:
+            return self._parse_block_slow(chunk)
+
+        rows = numbers[0::3]
+        cols = numbers[1::3]
+        values = numbers[2::3]
 
+        if min(rows) < 0 or max(rows) >= self.rows or min(cols) < 0 or max(cols) >= self.cols:
+            return self._parse_block_slow(chunk)
+
+        return rows, cols, values
+
+    def _parse_block_numpy(self, chunk):
+        if ENTRY_PATTERN.subn(b"", chunk)[1] != chunk.count(b"\n"):
+            return self._parse_block_numpy_slow(chunk)
+
+        np = load_numpy()
+        text = np.frombuffer(chunk.translate(None, b"() \t\r").replace(b"\n", b","), dtype=np.uint8)
+        ends = np.flatnonzero(text == ord(','))
+        starts = np.empty_like(ends)
+        starts[0] = 0
+        starts[1:] = ends[:-1] + 1
+
+        negative = text[starts] == ord('-')
+        if (ends - starts - negative).max() > MAX_INT64_DIGITS:
+            return self._parse_block_numpy_slow(chunk)
+
+        token_ids = np.repeat(np.arange(len(ends)), ends - starts + 1)
+        places = np.maximum(ends[token_ids] - np.arange(len(text)) - 1, 0)
+        digits = text.astype(np.int64) - ord('0')
+        digits[(text < ord('0')) | (text > ord('9'))] = 0
+
+        powers_of_ten = 10 ** np.arange(MAX_INT64_DIGITS + 1, dtype=np.int64)
+        numbers = np.add.reduceat(digits * powers_of_ten[places], starts)
+        numbers[negative] *= -1
+        rows, cols, values = numbers[0::3], numbers[1::3], numbers[2::3]
+
+        if (rows < 0).any() or (rows >= self.rows).any() or (cols < 0).any() or (cols >= self.cols).any():
+            return self._parse_block_numpy_slow(chunk)
+
+        return rows, cols, values
+
+    def _parse_block_numpy_slow(self, chunk):
+        np = load_numpy()
+        rows, cols, values = self._parse_block_slow(chunk)
         try:
-            rows_str = lines[0].strip()
-            cols_str = lines[1].strip()
+            return np.array(rows, dtype=np.int64), np.array(cols, dtype=np.int64), np.array(values, dtype=np.int64)
+        except OverflowError:
+            raise _int64_overflow_error(rows, cols, values) from None
+
+    def _parse_block_slow(self, chunk):
+        rows, cols, values = [], [], []
+        for line in io.StringIO(chunk.decode(), newline=None):
+            line = line.strip()
+            if not line:
+                continue
+
+            row, col, value = self._parse_entry(line)
+            rows.append(row)
+            cols.append(col)
+            values.append(value)
+
+        return rows, cols, values
+
+    def _read_dimensions(self, rows_line, cols_line):
+        try:
+            rows_str = rows_line.strip()
+            cols_str = cols_line.strip()
 
             if not rows_str.startswith("rows=") or not cols_str.startswith("cols="):
                 raise ValueError
@@ -31,36 +290,29 @@ class SparseMatrix:
             if self.rows <= 0 or self.cols <= 0:
                 raise ValueError("Matrix dimensions must be positive.")
 
-        except (IndexError, ValueError):
+        except ValueError:
             raise ValueError("Input file has wrong format: Missing or invalid rows/cols definitions.")
 
-        for i in range(2, len(lines)):
-            line = lines[i].strip()
-            if not line:
-                continue
-
-            if not (line.startswith('(') and line.endswith(')')):
-                raise ValueError("Input file has wrong format: Entry not enclosed in parentheses.")
+    def _parse_entry(self, line):
+        if not (line.startswith('(') and line.endswith(')')):
+            raise ValueError("Input file has wrong format: Entry not enclosed in parentheses.")
 
-            content = line[1:-1]
+        parts = line[1:-1].split(',')
+        if len(parts) != 3:
+            raise ValueError("Input file has wrong format: Entry does not have 3 comma-separated values.")
 
-            parts = content.split(',')
-            if len(parts) != 3:
-                raise ValueError("Input file has wrong format: Entry does not have 3 comma-separated values.")
-
-            try:
-                row = int(parts[0].strip())
-                col = int(parts[1].strip())
-                value = int(parts[2].strip())
-            except ValueError:
-                raise ValueError("Input file has wrong format: Row, column, or value is not an integer.")
+        try:
+            row = int(parts[0])
+            col = int(parts[1])
+            value = int(parts[2])
+        except ValueError:
+            raise ValueError("Input file has wrong format: Row, column, or value is not an integer.")
 
-            if not (0 <= row < self.rows and 0 <= col < self.cols):
-                raise ValueError(f"Input file has wrong format: Entry ({row}, {col}) out of bounds for matrix "
-                                 f"dimensions ({self.rows}, {self.cols}).")
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise ValueError(f"Input file has wrong format: Entry ({row}, {col}) out of bounds for matrix "
+                             f"dimensions ({self.rows}, {self.cols}).")
 
-            if value != 0:
-                self.matrix_data[(row, col)] = value
+        return row, col, value
 
     def getElement(self, currRow, currCol):
         if not (0 <= currRow < self.rows and 0 <= currCol < self.cols):
@@ -79,53 +331,373 @@ class SparseMatrix:
     def add(self, other_matrix):
         if self.rows != other_matrix.rows or self.cols != other_matrix.cols:
             raise ValueError("Matrix dimensions must match for addition.")
+        return self._merge(other_matrix, 1)
 
-        result_matrix = SparseMatrix(numRows=self.rows, numCols=self.cols)
-
-        for (r, c), val in self.matrix_data.items():
-            result_matrix.setElement(r, c, val)
-
-        for (r, c), val in other_matrix.matrix_data.items():
-            current_val = result_matrix.getElement(r, c)
-            result_matrix.setElement(r, c, current_val + val)
+    def subtract(self, other_matrix):
+        if self.rows != other_matrix.rows or self.cols != other_matrix.cols:
+            raise ValueError("Matrix dimensions must match for subtraction.")
+        return self._merge(other_matrix, -1)
 
-        return result_matrix
+    def add_into(self, other_matrix):
+        if self.rows != other_matrix.rows or self.cols != other_matrix.cols:
+            raise ValueError("Matrix dimensions must match for addition.")
+        self._merge_into(other_matrix, 1)
+        return self
 
-    def subtract(self, other_matrix):
+    def subtract_into(self, other_matrix):
         if self.rows != other_matrix.rows or self.cols != other_matrix.cols:
             raise ValueError("Matrix dimensions must match for subtraction.")
+        self._merge_into(other_matrix, -1)
+        return self
 
+    def _merge(self, other_matrix, sign):
         result_matrix = SparseMatrix(numRows=self.rows, numCols=self.cols)
+        result_matrix.matrix_data = self.matrix_data.copy()
+        result_matrix._merge_into(other_matrix, sign)
+        return result_matrix
 
-        for (r, c), val in self.matrix_data.items():
-            result_matrix.setElement(r, c, val)
+    def _merge_into(self, other_matrix, sign):
+        matrix_data = self.matrix_data
+        get = matrix_data.get
+
+        if other_matrix.matrix_data is matrix_data:
+            if sign < 0:
+                matrix_data.clear()
+            else:
+                for key, val in matrix_data.items():
+                    matrix_data[key] = val + val
+            return
+
+        for key, val in other_matrix.matrix_data.items():
+            total = get(key, 0) + sign * val
+            if total != 0:
+                matrix_data[key] = total
+            else:
+                matrix_data.pop(key, None)
+
+    @classmethod
+    def sum_all(cls, matrices):
+        matrices = iter(matrices)
+        first = next(matrices, None)
+        if first is None:
+            raise ValueError("At least one matrix is required for summation.")
+
+        result_matrix = cls(numRows=first.rows, numCols=first.cols)
+        totals = first.matrix_data.copy()
+        get = totals.get
+
+        for matrix in matrices:
+            if matrix.rows != first.rows or matrix.cols != first.cols:
+                raise ValueError("Matrix dimensions must match for addition.")
+            for key, val in matrix.matrix_data.items():
+                totals[key] = get(key, 0) + val
+
+        result_matrix.matrix_data = {key: val for key, val in totals.items() if val != 0}
+        return result_matrix
+
+    def __add__(self, other_matrix):
+        if not isinstance(other_matrix, SparseMatrix):
+            return NotImplemented
+        return self.add(other_matrix)
+
+    def __sub__(self, other_matrix):
+        if not isinstance(other_matrix, SparseMatrix):
+            return NotImplemented
+        return self.subtract(other_matrix)
+
+    def __matmul__(self, other_matrix):
+        if not isinstance(other_matrix, SparseMatrix):
+            return NotImplemented
+        return self.multiply(other_matrix)
 
-        for (r, c), val in other_matrix.matrix_data.items():
-            current_val = result_matrix.getElement(r, c)
-            result_matrix.setElement(r, c, current_val - val)
+    def __iadd__(self, other_matrix):
+        if not isinstance(other_matrix, SparseMatrix):
+            return NotImplemented
+        return self.add_into(other_matrix)
 
+    def __isub__(self, other_matrix):
+        if not isinstance(other_matrix, SparseMatrix):
+            return NotImplemented
+        return self.subtract_into(other_matrix)
+
+    def multiply(self, other_matrix, workers=1, semiring=None):
+        if self.cols != other_matrix.rows:
+            raise ValueError("Number of columns in the first matrix must equal "
+                             "number of rows in the second matrix for multiplication.")
+
+        if semiring is not None and semiring.kind != "plus_times":
+            if workers > 1:
+                raise ValueError("Semiring products do not support more than one worker.")
+            return self._multiply_semiring(other_matrix, semiring)
+
+        if workers > 1:
+            try:
+                return SparseMatrix.from_csr(self.to_csr()._multiply(other_matrix.to_csr(), workers))
+            except OverflowError:
+                pass
+
+        result_matrix = SparseMatrix(numRows=self.rows, numCols=other_matrix.cols)
+        result_data = result_matrix.matrix_data
+
+        other_rows = other_matrix._row_index()
+
+        for r1, row_entries in self._row_index().items():
+            row_sums = {}
+            for c1, val1 in row_entries:
+                other_row = other_rows.get(c1)
+                if other_row is None:
+                    continue
+                for c2, val2 in other_row:
+                    row_sums[c2] = row_sums.get(c2, 0) + val1 * val2
+
+            for c2, total in row_sums.items():
+                if total != 0:
+                    result_data[(r1, c2)] = total
         return result_matrix
 
-    def multiply(self, other_matrix):
+    def _multiply_semiring(self, other_matrix, semiring):
+        result_matrix = SparseMatrix(numRows=self.rows, numCols=other_matrix.cols)
+        result_data = result_matrix.matrix_data
+
+        kind = semiring.kind
+        add, mul, zero = semiring.add, semiring.mul, semiring.zero
+        other_rows = other_matrix._row_index()
+
+        for r1, row_entries in self._row_index().items():
+            row_sums = {}
+            for c1, val1 in row_entries:
+                other_row = other_rows.get(c1)
+                if other_row is None:
+                    continue
+
+                if kind == "min_plus":
+                    for c2, val2 in other_row:
+                        candidate = val1 + val2
+                        current = row_sums.get(c2)
+                        if current is None or candidate < current:
+                            row_sums[c2] = candidate
+                elif kind == "max_times":
+                    for c2, val2 in other_row:
+                        candidate = val1 * val2
+                        current = row_sums.get(c2)
+                        if current is None or candidate > current:
+                            row_sums[c2] = candidate
+                elif kind == "or_and":
+                    for c2, _ in other_row:
+                        row_sums[c2] = 1
+                elif kind == "mod":
+                    for c2, val2 in other_row:
+                        row_sums[c2] = row_sums.get(c2, 0) + val1 * val2
+                else:
+                    for c2, val2 in other_row:
+                        row_sums[c2] = add(row_sums.get(c2, zero), mul(val1, val2))
+
+            if kind == "mod":
+                modulus = semiring.modulus
+                row_sums = {c2: total % modulus for c2, total in row_sums.items()}
+
+            for c2, total in row_sums.items():
+                if total == zero:
+                    continue
+                if total == 0:
+                    raise ValueError(f"Semiring product has a zero entry at ({r1}, {c2}), which cannot be stored "
+                                     f"because the semiring zero is {zero}.")
+                result_data[(r1, c2)] = total
+
+        return result_matrix
+
+    def multiply_masked(self, other_matrix, mask_matrix):
         if self.cols != other_matrix.rows:
             raise ValueError("Number of columns in the first matrix must equal "
                              "number of rows in the second matrix for multiplication.")
+        if mask_matrix.rows != self.rows or mask_matrix.cols != other_matrix.cols:
+            raise ValueError("Mask dimensions must match the dimensions of the product.")
 
         result_matrix = SparseMatrix(numRows=self.rows, numCols=other_matrix.cols)
+        result_data = result_matrix.matrix_data
+
+        left_rows = {r: dict(entries) for r, entries in self._row_index().items()}
+        right_cols = {c: dict(entries) for c, entries in other_matrix._col_index().items()}
+
+        for r, c in mask_matrix.matrix_data:
+            row_entries = left_rows.get(r)
+            col_entries = right_cols.get(c)
+            if row_entries is None or col_entries is None:
+                continue
 
-        for (r1, c1), val1 in self.matrix_data.items():
-            for (r2, c2), val2 in other_matrix.matrix_data.items():
-                if c1 == r2:
-                    current_sum = result_matrix.getElement(r1, c2)
-                    result_matrix.setElement(r1, c2, current_sum + (val1 * val2))
+            if len(row_entries) > len(col_entries):
+                row_entries, col_entries = col_entries, row_entries
+
+            total = 0
+            for k, val in row_entries.items():
+                other_val = col_entries.get(k)
+                if other_val is not None:
+                    total += val * other_val
+
+            if total != 0:
+                result_data[(r, c)] = total
+
+        return result_matrix
+
+    def matvec(self, x):
+        return self.to_csr().matvec(x)
+
+    def rmatvec(self, x):
+        return self.to_csr().rmatvec(x)
+
+    def multiply_dense(self, dense_matrix):
+        return self.to_csr().multiply_dense(dense_matrix)
+
+    def transpose(self):
+        result_matrix = SparseMatrix(numRows=self.cols, numCols=self.rows)
+
+        entries = list(self.matrix_data.items())
+        next_slot = [0] * (self.cols + 1)
+        for (_, c), _ in entries:
+            next_slot[c + 1] += 1
+        for c in range(self.cols):
+            next_slot[c + 1] += next_slot[c]
+
+        by_col = [None] * len(entries)
+        for entry in entries:
+            c = entry[0][1]
+            by_col[next_slot[c]] = entry
+            next_slot[c] += 1
+
+        result_matrix.matrix_data = {(c, r): val for (r, c), val in by_col}
+        return result_matrix
+
+    def _row_index(self):
+        row_index = {}
+        for (r, c), val in self.matrix_data.items():
+            entries = row_index.get(r)
+            if entries is None:
+                row_index[r] = [(c, val)]
+            else:
+                entries.append((c, val))
+        return row_index
+
+    def _col_index(self):
+        col_index = {}
+        for (r, c), val in self.matrix_data.items():
+            entries = col_index.get(c)
+            if entries is None:
+                col_index[c] = [(r, val)]
+            else:
+                entries.append((r, val))
+        return col_index
+
+    @classmethod
+    def from_coo(cls, coo_matrix):
+        result_matrix = cls(numRows=coo_matrix.rows, numCols=coo_matrix.cols)
+        result_matrix.matrix_data = coo_matrix.to_dict()
         return result_matrix
 
+    def to_coo(self, row_sorted=True):
+        entries = sorted(self.matrix_data.items()) if row_sorted else self.matrix_data.items()
+        row_indices, col_indices, data = array('q'), array('q'), array('q')
+        for (r, c), val in entries:
+            row_indices.append(r)
+            col_indices.append(c)
+            data.append(val)
+        return COOMatrix(self.rows, self.cols, row_indices, col_indices, data, row_sorted=row_sorted)
+
+    def save_binary(self, path):
+        try:
+            coo_matrix = self.to_coo()
+        except OverflowError:
+            raise ValueError("Matrix has an entry that does not fit in a 64-bit integer and cannot be saved "
+                             "in binary format.") from None
+        coo_matrix.save_binary(path)
+
+    @classmethod
+    def load_binary(cls, path, use_mmap=False):
+        return cls.from_coo(COOMatrix.load_binary(path, use_mmap))
+
+    def to_csr(self):
+        return CSRMatrix.from_dict(self.rows, self.cols, self.matrix_data)
+
+    @classmethod
+    def from_csr(cls, csr_matrix):
+        result_matrix = cls(numRows=csr_matrix.rows, numCols=csr_matrix.cols)
+        result_matrix.matrix_data = csr_matrix.to_dict()
+        return result_matrix
+
+    def to_csc(self):
+        return CSCMatrix.from_dict(self.rows, self.cols, self.matrix_data)
+
+    @classmethod
+    def from_csc(cls, csc_matrix):
+        result_matrix = cls(numRows=csc_matrix.rows, numCols=csc_matrix.cols)
+        result_matrix.matrix_data = csc_matrix.to_dict()
+        return result_matrix
+
+    def iter_lines(self):
+        yield f"rows={self.rows}\n"
+        yield f"cols={self.cols}\n"
+        matrix_data = self.matrix_data
+        for r, c in sorted(matrix_data):
+            yield f"({r}, {c}, {matrix_data[(r, c)]})\n"
+
+    def write_to(self, file_obj):
+        file_obj.writelines(self.iter_lines())
+
     def to_string(self):
-        output = f"rows={self.rows}\ncols={self.cols}\n"
-        sorted_keys = sorted(self.matrix_data.keys())
-        for r, c in sorted_keys:
-            output += f"({r}, {c}, {self.matrix_data[(r, c)]})\n"
-        return output
+        return "".join(self.iter_lines())
+
+def _source_key(matrixFilePath):
+    stat = os.stat(matrixFilePath)
+    return {"path": os.path.realpath(matrixFilePath), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+def _file_digest(matrixFilePath):
+    digest = hashlib.sha256()
+    with open(matrixFilePath, 'rb') as f:
+        for block in iter(lambda: f.read(READ_BUFFER_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _read_cache_key(keyPath):
+    try:
+        with open(keyPath, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or set(cached) != {"path", "size", "mtime_ns", "sha256", "cache_sha256"}:
+        return None
+    return cached
+
+def _write_cache_key(keyPath, source):
+    temp_path = f"{keyPath}.{os.getpid()}.tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(source, f)
+    os.replace(temp_path, keyPath)
+
+def _int64_overflow_error(rows, cols, values):
+    for row, col, value in zip(rows, cols, values):
+        if not all(-INT64_LIMIT <= number < INT64_LIMIT for number in (row, col, value)):
+            return ValueError(f"Input file has wrong format: Entry ({row}, {col}, {value}) does not fit in a "
+                              f"64-bit integer.")
+    return ValueError("Input file has wrong format: Row, column, or value does not fit in a 64-bit integer.")
+
+def _parse_file_range(matrixFilePath, start, end, numRows, numCols, use_numpy):
+    reader = SparseMatrix(numRows=numRows, numCols=numCols)
+    parse_block = reader._parse_block_numpy if use_numpy else reader._parse_block
+
+    with open(matrixFilePath, 'rb', buffering=0) as f:
+        f.seek(start)
+        try:
+            return reader._collect_coo((parse_block(chunk) for chunk in reader._range_chunks(f, end)), use_numpy)
+        except ValueError:
+            if use_numpy:
+                raise
+
+        f.seek(start)
+        row_indices, col_indices, data = [], [], []
+        for rows, cols, values in map(parse_block, reader._range_chunks(f, end)):
+            row_indices.extend(rows)
+            col_indices.extend(cols)
+            data.extend(values)
+        return row_indices, col_indices, data
 
 def main():
     print("Welcome to the Sparse Matrix Operations Program!")
@@ -182,7 +754,7 @@ def main():
                 result_matrix = matrix1.multiply(matrix2)
 
             print(f"\n--- Result of {operation_name} ---")
-            print(result_matrix.to_string())
+            result_matrix.write_to(sys.stdout)
 
             output_filename = f"result_{operation_name.lower()}_{os.path.basename(file1_path).split('.')[0]}_" \
                               f"{os.path.basename(file2_path).split('.')[0]}.txt"
@@ -190,8 +762,8 @@ def main():
             os.makedirs(output_dir, exist_ok=True)
             output_filepath = os.path.join(output_dir, output_filename)
 
-            with open(output_filepath, 'w') as f:
-                f.write(result_matrix.to_string())
+            with open(output_filepath, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+                result_matrix.write_to(f)
             print(f"Result saved to: {output_filepath}")
 
         except ValueError as e:
@@ -199,5 +771,54 @@ def main():
         except Exception as e:
             print(f"An unexpected error occurred: {e}")
 
+def run_cli(argv):
+    parser = argparse.ArgumentParser(prog="sparse_matrix.py",
+                                     description="Apply a sparse matrix operation to two matrix files.")
+    parser.add_argument("operation", choices=["add", "subtract", "multiply"])
+    parser.add_argument("first_matrix", help="path to the left operand (text or binary format)")
+    parser.add_argument("second_matrix", help="path to the right operand (text or binary format)")
+    parser.add_argument("-o", "--output", help="result file; the text result goes to stdout when omitted")
+    parser.add_argument("--format", choices=["text", "binary"], default="text", help="result file format")
+    parser.add_argument("--workers", type=int, default=1, help="processes used for parsing and multiplication")
+    parser.add_argument("--parse-cache", action="store_true",
+                        help="reuse a binary sidecar of each parsed text input while the input is unchanged")
+    args = parser.parse_args(argv)
+
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.format == "binary" and not args.output:
+        parser.error("--format binary requires --output")
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    try:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            matrix1, matrix2 = pool.map(lambda path: SparseMatrix.load(path, workers=args.workers,
+                                                                            parse_cache=args.parse_cache),
+                                        [args.first_matrix, args.second_matrix])
+
+        if args.operation == "add":
+            result_matrix = matrix1.add(matrix2)
+        elif args.operation == "subtract":
+            result_matrix = matrix1.subtract(matrix2)
+        else:
+            result_matrix = matrix1.multiply(matrix2, workers=args.workers)
+
+        if args.format == "binary":
+            result_matrix.save_binary(args.output)
+        elif args.output:
+            with open(args.output, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+                result_matrix.write_to(f)
+        else:
+            result_matrix.write_to(sys.stdout)
+
+    except (OSError, ValueError, OverflowError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    return 0
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
+    main()
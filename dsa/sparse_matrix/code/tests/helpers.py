@@ -0,0 +1,59 @@
+import random
+
+from sparse_matrix import SparseMatrix
+
+
+def make_matrix(numRows, numCols, entries):
+    matrix = SparseMatrix(numRows=numRows, numCols=numCols)
+    for (r, c), val in entries.items():
+        matrix.setElement(r, c, val)
+    return matrix
+
+
+def random_matrix(rnd, numRows, numCols, nnz):
+    return make_matrix(numRows, numCols, {(rnd.randrange(numRows), rnd.randrange(numCols)): rnd.randint(-3, 3)
+                                          for _ in range(nnz)})
+
+
+def random_matrices(seed, count=25, max_dim=9, nnz=20):
+    rnd = random.Random(seed)
+    for _ in range(count):
+        yield random_matrix(rnd, rnd.randint(1, max_dim), rnd.randint(1, max_dim), nnz)
+
+
+def operand_pairs(seed, count=25, max_dim=9):
+    rnd = random.Random(seed)
+    for _ in range(count):
+        numRows, inner, numCols = rnd.randint(1, max_dim), rnd.randint(1, max_dim), rnd.randint(1, max_dim)
+        yield (random_matrix(rnd, numRows, inner, rnd.randint(0, 30)),
+               random_matrix(rnd, inner, numCols, rnd.randint(0, 30)))
+
+
+def same_shape_pairs(seed, count=25, max_dim=9, nnz=20):
+    rnd = random.Random(seed)
+    for _ in range(count):
+        numRows, numCols = rnd.randint(1, max_dim), rnd.randint(1, max_dim)
+        yield random_matrix(rnd, numRows, numCols, nnz), random_matrix(rnd, numRows, numCols, nnz)
+
+
+def to_dense(matrix):
+    dense = [[0] * matrix.cols for _ in range(matrix.rows)]
+    for (r, c), val in matrix.matrix_data.items():
+        dense[r][c] = val
+    return dense
+
+
+def dense_product(left, right):
+    return [[sum(a * b for a, b in zip(row, col)) for col in zip(*right)] for row in left]
+
+
+def dense_combine(left, right, sign):
+    return [[a + sign * b for a, b in zip(*rows)] for rows in zip(left, right)]
+
+
+def dense_to_dict(dense):
+    return {(r, c): val for r, row in enumerate(dense) for c, val in enumerate(row) if val != 0}
+
+
+def expected_product(left, right):
+    return dense_to_dict(dense_product(to_dense(left), to_dense(right)))
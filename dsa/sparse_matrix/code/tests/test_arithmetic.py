@@ -0,0 +1,172 @@
+import math
+import operator
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from helpers import (dense_combine, dense_to_dict, expected_product, make_matrix, operand_pairs, same_shape_pairs,
+                     to_dense)
+from semiring import MAX_TIMES, MIN_PLUS, OR_AND, Semiring, modular_semiring
+from sparse_matrix import SparseMatrix
+
+
+class MergeAddSubtractTest(unittest.TestCase):
+    def test_matches_dense_sum_and_difference(self):
+        for first, second in same_shape_pairs(5):
+            dense_first, dense_second = to_dense(first), to_dense(second)
+            self.assertEqual(first.add(second).matrix_data, dense_to_dict(dense_combine(dense_first, dense_second, 1)))
+            self.assertEqual(first.subtract(second).matrix_data,
+                             dense_to_dict(dense_combine(dense_first, dense_second, -1)))
+
+    def test_operands_are_not_modified(self):
+        for first, second in same_shape_pairs(6, count=5):
+            before = dict(first.matrix_data), dict(second.matrix_data)
+            first.add(second)
+            first.subtract(second)
+            self.assertEqual((first.matrix_data, second.matrix_data), before)
+
+    def test_rejects_mismatched_dimensions(self):
+        with self.assertRaises(ValueError):
+            make_matrix(2, 2, {}).add(make_matrix(2, 3, {}))
+        with self.assertRaises(ValueError):
+            make_matrix(2, 2, {}).subtract(make_matrix(3, 2, {}))
+
+
+class InPlaceAliasingTest(unittest.TestCase):
+    def setUp(self):
+        self.entries = {(0, 0): 3, (1, 2): -4, (2, 1): 5}
+
+    def test_subtract_self_in_place(self):
+        matrix = make_matrix(3, 3, self.entries)
+        matrix -= matrix
+        self.assertEqual(matrix.matrix_data, {})
+
+        matrix = make_matrix(3, 3, self.entries)
+        self.assertIs(matrix.subtract_into(matrix), matrix)
+        self.assertEqual(matrix.matrix_data, {})
+
+    def test_add_self_in_place(self):
+        matrix = make_matrix(3, 3, self.entries)
+        matrix += matrix
+        self.assertEqual(matrix.matrix_data, {key: 2 * val for key, val in self.entries.items()})
+
+        matrix = make_matrix(3, 3, self.entries)
+        matrix.add_into(matrix)
+        self.assertEqual(matrix.matrix_data, {key: 2 * val for key, val in self.entries.items()})
+
+    def test_self_operations_match_copies(self):
+        matrix = make_matrix(3, 3, self.entries)
+        self.assertEqual((matrix + matrix).matrix_data, matrix.add(make_matrix(3, 3, self.entries)).matrix_data)
+        self.assertEqual((matrix - matrix).matrix_data, {})
+        self.assertEqual(matrix.matrix_data, self.entries)
+
+
+class SumAllTest(unittest.TestCase):
+    def test_matches_chained_adds(self):
+        for first, second in same_shape_pairs(9):
+            negated = make_matrix(first.rows, first.cols, {key: -val for key, val in first.matrix_data.items()})
+            for matrices in ([first], [first, second], [first, second, first], [first, second, negated]):
+                expected = matrices[0]
+                for matrix in matrices[1:]:
+                    expected = expected.add(matrix)
+                self.assertEqual(SparseMatrix.sum_all(matrices).matrix_data, expected.matrix_data)
+                self.assertEqual(SparseMatrix.sum_all(iter(matrices)).matrix_data, expected.matrix_data)
+
+    def test_rejects_empty_and_mismatched_inputs(self):
+        with self.assertRaises(ValueError):
+            SparseMatrix.sum_all([])
+        with self.assertRaises(ValueError):
+            SparseMatrix.sum_all([make_matrix(2, 2, {}), make_matrix(2, 3, {})])
+
+
+class OperatorTest(unittest.TestCase):
+    def test_operators_match_methods(self):
+        for first, second in same_shape_pairs(7):
+            self.assertEqual((first + second).matrix_data, first.add(second).matrix_data)
+            self.assertEqual((first - second).matrix_data, first.subtract(second).matrix_data)
+
+        for left, right in operand_pairs(12):
+            self.assertEqual((left @ right).matrix_data, expected_product(left, right))
+
+    def test_in_place_operators_keep_identity(self):
+        for first, second in same_shape_pairs(8):
+            expected = first.add(second).subtract(second).add(second).matrix_data
+            target = first
+            target += second
+            target -= second
+            target.add_into(second)
+            self.assertIs(target, first)
+            self.assertEqual(first.matrix_data, expected)
+
+    def test_other_operands_are_not_implemented(self):
+        matrix = make_matrix(2, 2, {(0, 0): 1})
+        for other in (1, [[1, 0], [0, 1]], "matrix"):
+            with self.assertRaises(TypeError):
+                matrix + other
+            with self.assertRaises(TypeError):
+                matrix - other
+            with self.assertRaises(TypeError):
+                matrix @ other
+
+
+def semiring_product(left, right, semiring):
+    result = {}
+    for r in range(left.rows):
+        for c in range(right.cols):
+            terms = [semiring.mul(left.matrix_data[(r, k)], right.matrix_data[(k, c)]) for k in range(left.cols)
+                     if (r, k) in left.matrix_data and (k, c) in right.matrix_data]
+            if not terms:
+                continue
+            total = semiring.zero
+            for term in terms:
+                total = semiring.add(total, term)
+            if total != semiring.zero:
+                result[(r, c)] = total
+    return result
+
+
+class SemiringMultiplyTest(unittest.TestCase):
+    def test_matches_reference_loop(self):
+        semirings = {
+            "min_plus": MIN_PLUS,
+            "max_times": MAX_TIMES,
+            "or_and": OR_AND,
+            "mod_7": modular_semiring(7),
+            "custom_max_plus": Semiring(max, operator.add, -math.inf),
+            "custom_plus_square": Semiring(operator.add, lambda a, b: (a * b) ** 2, 0),
+        }
+        pairs = list(operand_pairs(17))
+        pairs += [(make_matrix(left.rows, left.cols, {key: abs(val) for key, val in left.matrix_data.items()}),
+                   make_matrix(right.rows, right.cols, {key: abs(val) for key, val in right.matrix_data.items()}))
+                  for left, right in pairs]
+        for name, semiring in semirings.items():
+            for left, right in pairs:
+                expected = semiring_product(left, right, semiring)
+                with self.subTest(semiring=name, shape=(left.rows, left.cols, right.cols)):
+                    if 0 in expected.values():
+                        with self.assertRaises(ValueError):
+                            left.multiply(right, semiring=semiring)
+                    else:
+                        self.assertEqual(left.multiply(right, semiring=semiring).matrix_data, expected)
+
+    def test_min_plus_rejects_zero_results(self):
+        left = make_matrix(1, 2, {(0, 0): 3, (0, 1): 2})
+        right = make_matrix(2, 1, {(0, 0): -3, (1, 0): 5})
+        with self.assertRaisesRegex(ValueError, r"\(0, 0\)"):
+            left.multiply(right, semiring=MIN_PLUS)
+
+    def test_min_plus_keeps_nonzero_results(self):
+        product = make_matrix(1, 1, {(0, 0): -2}).multiply(make_matrix(1, 2, {(0, 0): 3, (0, 1): 7}),
+                                                           semiring=MIN_PLUS)
+        self.assertEqual(product.matrix_data, {(0, 0): 1, (0, 1): 5})
+
+    def test_modular_results_are_reduced(self):
+        product = make_matrix(1, 2, {(0, 0): 3, (0, 1): 4}).multiply(make_matrix(2, 1, {(0, 0): 3, (1, 0): 1}),
+                                                                       semiring=modular_semiring(13))
+        self.assertEqual(product.matrix_data, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
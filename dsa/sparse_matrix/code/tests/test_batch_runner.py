@@ -0,0 +1,92 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import batch_runner
+from helpers import make_matrix
+from sparse_matrix import SparseMatrix
+
+SAMPLE_INPUTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "sample_inputs")
+
+
+class RunManifestTest(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.work_dir.cleanup)
+        matrix_path = os.path.join(SAMPLE_INPUTS, "easy_sample_01_2.txt")
+        self.jobs = [{"operation": operation, "first_matrix": matrix_path, "second_matrix": matrix_path}
+                     for operation in ("add", "subtract")]
+
+    def test_unexpected_error_fails_only_its_job(self):
+        with mock.patch.object(SparseMatrix, "add", side_effect=KeyError((0, 0))):
+            summary = batch_runner.run_manifest(self.jobs, self.work_dir.name)
+
+        statuses = [report["status"] for report in summary["jobs"]]
+        self.assertEqual(statuses, ["error", "ok"])
+        self.assertIn("KeyError", summary["jobs"][0]["error"])
+
+    def test_process_workers_match_serial_run(self):
+        paths = [os.path.join(SAMPLE_INPUTS, name) for name in ("easy_sample_01_2.txt", "bad_value.txt")]
+        paths.append(os.path.join(self.work_dir.name, "square.txt"))
+        with open(paths[2], 'w') as f:
+            make_matrix(3, 3, {(0, 1): 2, (1, 2): -3, (2, 0): 4}).write_to(f)
+        jobs = [{"operation": "add", "first_matrix": paths[0], "second_matrix": paths[0]},
+                {"operation": "multiply", "first_matrix": paths[2], "second_matrix": paths[2]},
+                {"operation": "subtract", "first_matrix": paths[0], "second_matrix": paths[0]},
+                {"operation": "add", "first_matrix": paths[1], "second_matrix": paths[2]}]
+        for i, job in enumerate(jobs):
+            job["output"] = os.path.join(self.work_dir.name, f"job{i}.txt")
+
+        serial = batch_runner.run_manifest(jobs, self.work_dir.name)
+        expected = {}
+        for job, report in zip(jobs, serial["jobs"]):
+            if report["status"] == "ok":
+                with open(job["output"]) as f:
+                    expected[job["output"]] = f.read()
+
+        summary = batch_runner.run_manifest(jobs, self.work_dir.name, workers=2, parse_workers=2)
+        self.assertEqual([report["job"] for report in summary["jobs"]], [0, 1, 2, 3])
+        self.assertEqual([report["status"] for report in summary["jobs"]],
+                         [report["status"] for report in serial["jobs"]])
+        self.assertEqual(summary["matrices_loaded"], serial["matrices_loaded"])
+        for path, text in expected.items():
+            with open(path) as f:
+                self.assertEqual(f.read(), text)
+
+
+class GroupJobsTest(unittest.TestCase):
+    def test_jobs_sharing_a_file_share_a_group(self):
+        jobs = [{"operation": "add", "first_matrix": first, "second_matrix": second}
+                for first, second in (("a", "b"), ("c", "d"), ("b", "e"), ("e", "a"), ("f", "f"))]
+        groups = batch_runner.group_jobs(jobs)
+        self.assertEqual([[index for index, _ in group] for group in groups], [[0, 2, 3], [1], [4]])
+
+
+class LoadManifestTest(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.work_dir.cleanup)
+
+    def write_manifest(self, text):
+        path = os.path.join(self.work_dir.name, "manifest.json")
+        with open(path, 'w') as f:
+            f.write(text)
+        return path
+
+    def test_rejects_non_object_jobs(self):
+        for text in ("[1]", "[[\"add\"]]", "3", "{\"jobs\": 1}"):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    batch_runner.load_manifest(self.write_manifest(text))
+
+    def test_main_reports_invalid_manifest(self):
+        with mock.patch("sys.stderr"):
+            self.assertEqual(batch_runner.main([self.write_manifest("[1]")]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
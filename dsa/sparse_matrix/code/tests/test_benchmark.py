@@ -0,0 +1,39 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import benchmark
+from matrix_generator import write_matrix
+from sparse_matrix import SparseMatrix
+
+
+class GenerateMatrixTest(unittest.TestCase):
+    def test_distributions_have_exact_nnz(self):
+        for distribution in benchmark.DISTRIBUTIONS:
+            with self.subTest(distribution=distribution):
+                matrix = benchmark.generate_matrix(distribution, 1000, 1000, 10_000, seed=4)
+                self.assertEqual(len(matrix.matrix_data), 10_000)
+                self.assertNotIn(0, matrix.matrix_data.values())
+
+    def test_streamed_load_file_matches_generated_matrix(self):
+        with tempfile.TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir, "matrix.txt")
+            for distribution in benchmark.DISTRIBUTIONS:
+                with self.subTest(distribution=distribution):
+                    with open(path, 'w') as f:
+                        write_matrix(f, min_value=-benchmark.VALUE_RANGE, max_value=benchmark.VALUE_RANGE,
+                                     **benchmark.generator_options(distribution, 300, 300, 2000, 5))
+                    self.assertEqual(SparseMatrix(matrixFilePath=path).matrix_data,
+                                     benchmark.generate_matrix(distribution, 300, 300, 2000, 5).matrix_data)
+
+    def test_run_benchmarks_reports_every_case(self):
+        summary = benchmark.run_benchmarks(["banded"], [200], [1000], benchmark.OPERATIONS, warmup=0, repeat=1)
+        self.assertEqual([result["operation"] for result in summary["results"]], list(benchmark.OPERATIONS))
+        self.assertTrue(all(result["nnz"] == 1000 for result in summary["results"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import struct
+import sys
+import tempfile
+import unittest
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from compressed import BINARY_HEADER_SIZE, COOMatrix
+from sparse_matrix import SparseMatrix
+
+
+class BinaryFormatTest(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.work_dir.cleanup)
+        self.path = os.path.join(self.work_dir.name, "matrix.spmx")
+
+        self.matrix = SparseMatrix(numRows=3, numCols=3)
+        for (r, c), val in {(0, 1): 5, (2, 0): -7, (2, 2): 1}.items():
+            self.matrix.setElement(r, c, val)
+        self.matrix.save_binary(self.path)
+
+    def patch_word(self, buffer_index, entry_index, value):
+        with open(self.path, 'r+b') as f:
+            f.seek(BINARY_HEADER_SIZE + 8 * (3 * buffer_index + entry_index))
+            f.write(struct.pack("<q", value))
+
+    def test_round_trip(self):
+        for use_mmap in (False, True):
+            with self.subTest(use_mmap=use_mmap):
+                loaded = SparseMatrix.load_binary(self.path, use_mmap)
+                self.assertEqual(loaded.matrix_data, self.matrix.matrix_data)
+                self.assertEqual(SparseMatrix.load(self.path).to_string(), self.matrix.to_string())
+
+    def test_rejects_out_of_bounds_indices(self):
+        for buffer_index, value in ((0, 99), (0, -1), (1, 3), (1, -5)):
+            with self.subTest(buffer_index=buffer_index, value=value):
+                self.matrix.save_binary(self.path)
+                self.patch_word(buffer_index, 1, value)
+                for use_mmap in (False, True):
+                    with self.assertRaises(ValueError):
+                        SparseMatrix.load_binary(self.path, use_mmap)
+
+    def test_rejects_unsorted_row_major_entries(self):
+        for buffer_index, entry_index, value in ((0, 0, 2), (1, 2, 0), (0, 2, 1)):
+            with self.subTest(buffer_index=buffer_index, entry_index=entry_index, value=value):
+                self.matrix.save_binary(self.path)
+                self.patch_word(buffer_index, entry_index, value)
+                for use_mmap in (False, True):
+                    with self.assertRaisesRegex(ValueError, "row-major"):
+                        SparseMatrix.load_binary(self.path, use_mmap)
+
+    def test_unsorted_files_accept_any_order(self):
+        entries = sorted(self.matrix.matrix_data.items(), reverse=True)
+        COOMatrix(3, 3, array('q', [r for (r, _), _ in entries]), array('q', [c for (_, c), _ in entries]),
+                  array('q', [val for _, val in entries])).save_binary(self.path)
+        for use_mmap in (False, True):
+            self.assertEqual(SparseMatrix.load_binary(self.path, use_mmap).matrix_data, self.matrix.matrix_data)
+
+    def test_rejects_zero_values(self):
+        self.patch_word(2, 0, 0)
+        with self.assertRaises(ValueError):
+            SparseMatrix.load(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
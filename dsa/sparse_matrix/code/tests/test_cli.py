@@ -0,0 +1,92 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from helpers import make_matrix
+from sparse_matrix import SparseMatrix, run_cli
+
+
+class RunCliTest(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.work_dir.cleanup)
+        self.first = make_matrix(3, 3, {(0, 0): 4, (1, 2): -2, (2, 1): 7})
+        self.second = make_matrix(3, 3, {(0, 0): -4, (1, 1): 5, (2, 1): 1})
+        self.first_path = self.write_matrix(self.first, "first.txt")
+        self.second_path = self.write_matrix(self.second, "second.txt")
+
+    def write_matrix(self, matrix, name):
+        path = os.path.join(self.work_dir.name, name)
+        with open(path, 'w') as f:
+            matrix.write_to(f)
+        return path
+
+    def run_cli(self, *argv):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                status = run_cli(list(argv))
+            except SystemExit as e:
+                status = e.code
+        return status, stdout.getvalue(), stderr.getvalue()
+
+    def test_writes_result_to_stdout(self):
+        expected = {
+            "add": self.first.add(self.second),
+            "subtract": self.first.subtract(self.second),
+            "multiply": self.first.multiply(self.second),
+        }
+        for operation, result_matrix in expected.items():
+            with self.subTest(operation=operation):
+                self.assertEqual(self.run_cli(operation, self.first_path, self.second_path),
+                                 (0, result_matrix.to_string(), ""))
+
+    def test_writes_text_and_binary_output_files(self):
+        output = os.path.join(self.work_dir.name, "result.txt")
+        self.assertEqual(self.run_cli("add", self.first_path, self.second_path, "-o", output), (0, "", ""))
+        self.assertEqual(SparseMatrix(matrixFilePath=output).matrix_data, self.first.add(self.second).matrix_data)
+
+        output = os.path.join(self.work_dir.name, "result.spmx")
+        self.assertEqual(self.run_cli("multiply", self.first_path, self.second_path, "--format", "binary",
+                                      "-o", output, "--workers", "2"), (0, "", ""))
+        self.assertEqual(SparseMatrix.load_binary(output).matrix_data, self.first.multiply(self.second).matrix_data)
+
+    def test_usage_errors_exit_with_two(self):
+        for argv in (("add", self.first_path, self.second_path, "--format", "binary"),
+                     ("add", self.first_path, self.second_path, "--workers", "0"),
+                     ("divide", self.first_path, self.second_path),
+                     ("add", self.first_path)):
+            with self.subTest(argv=argv):
+                status, stdout, stderr = self.run_cli(*argv)
+                self.assertEqual((status, stdout), (2, ""))
+                self.assertIn("usage:", stderr)
+
+    def test_runtime_errors_exit_with_one(self):
+        narrow_path = self.write_matrix(make_matrix(3, 2, {(0, 0): 1}), "narrow.txt")
+        for argv in (("add", self.first_path, os.path.join(self.work_dir.name, "missing.txt")),
+                     ("add", self.first_path, narrow_path),
+                     ("multiply", narrow_path, self.first_path)):
+            with self.subTest(argv=argv):
+                status, stdout, stderr = self.run_cli(*argv)
+                self.assertEqual((status, stdout), (1, ""))
+                self.assertTrue(stderr.startswith("Error: "))
+
+    def test_entries_beyond_int64(self):
+        big_path = self.write_matrix(make_matrix(2, 2, {(0, 0): 2 ** 62, (1, 1): 3}), "big.txt")
+        output = os.path.join(self.work_dir.name, "big.spmx")
+
+        status, stdout, stderr = self.run_cli("add", big_path, big_path, "--format", "binary", "-o", output)
+        self.assertEqual((status, stdout), (1, ""))
+        self.assertIn("64-bit", stderr)
+
+        self.assertEqual(self.run_cli("multiply", big_path, big_path, "--workers", "2"),
+                         (0, make_matrix(2, 2, {(0, 0): 2 ** 124, (1, 1): 9}).to_string(), ""))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from compressed import CSRMatrix
+from helpers import random_matrices, to_dense
+from sparse_matrix import SparseMatrix
+
+
+class CSRMatrixTest(unittest.TestCase):
+    def test_round_trip(self):
+        for matrix in random_matrices(5):
+            csr_matrix = matrix.to_csr()
+            self.assertEqual(csr_matrix.to_dict(), matrix.matrix_data)
+            self.assertEqual(csr_matrix.nnz(), len(matrix.matrix_data))
+            self.assertEqual(SparseMatrix.from_csr(csr_matrix).matrix_data, matrix.matrix_data)
+
+    def test_get_and_set_element_match_dict(self):
+        for matrix in random_matrices(6):
+            csr_matrix = matrix.to_csr()
+            for r in range(matrix.rows):
+                for c in range(matrix.cols):
+                    self.assertEqual(csr_matrix.getElement(r, c), matrix.getElement(r, c))
+
+            for r, c, val in ((0, 0, 4), (matrix.rows - 1, matrix.cols - 1, 0), (0, matrix.cols - 1, -2)):
+                matrix.setElement(r, c, val)
+                csr_matrix.setElement(r, c, val)
+            self.assertEqual(csr_matrix.to_dict(), matrix.matrix_data)
+
+    def test_rejects_out_of_bounds_access(self):
+        csr_matrix = CSRMatrix(2, 3)
+        with self.assertRaises(IndexError):
+            csr_matrix.getElement(2, 0)
+        with self.assertRaises(IndexError):
+            csr_matrix.setElement(0, 3, 1)
+
+
+class CSCMatrixTest(unittest.TestCase):
+    def test_round_trip(self):
+        for matrix in random_matrices(7):
+            csc_matrix = matrix.to_csc()
+            self.assertEqual(csc_matrix.to_dict(), matrix.matrix_data)
+            self.assertEqual(csc_matrix.nnz(), len(matrix.matrix_data))
+            self.assertEqual(SparseMatrix.from_csc(csc_matrix).matrix_data, matrix.matrix_data)
+            self.assertEqual(csc_matrix.to_csr().to_dict(), matrix.matrix_data)
+
+    def test_column_traversal(self):
+        for matrix in random_matrices(8):
+            csc_matrix = matrix.to_csc()
+            dense = to_dense(matrix)
+            self.assertEqual(csc_matrix.column_sums(), [sum(col) for col in zip(*dense)])
+            for r in range(matrix.rows):
+                for c in range(matrix.cols):
+                    self.assertEqual(csc_matrix.getElement(r, c), dense[r][c])
+            with self.assertRaises(IndexError):
+                csc_matrix.getElement(matrix.rows, 0)
+
+
+class TransposeTest(unittest.TestCase):
+    def test_matches_dense_transpose(self):
+        for matrix in random_matrices(10):
+            expected = [list(col) for col in zip(*to_dense(matrix))]
+            transposed = matrix.transpose()
+            self.assertEqual((transposed.rows, transposed.cols), (matrix.cols, matrix.rows))
+            self.assertEqual(to_dense(transposed), expected)
+            self.assertEqual(matrix.to_csr().transpose().to_dict(), transposed.matrix_data)
+            self.assertEqual(list(matrix.to_csr().transpose().indices), list(transposed.to_csr().indices))
+
+    def test_transpose_view_shares_buffers(self):
+        for matrix in random_matrices(11):
+            csr_matrix = matrix.to_csr()
+            view = csr_matrix.transpose_view()
+            self.assertEqual((view.rows, view.cols), (matrix.cols, matrix.rows))
+            self.assertIs(view.data, csr_matrix.data)
+            self.assertEqual(view.to_dict(), matrix.transpose().matrix_data)
+            self.assertEqual(view.transpose_view().to_dict(), matrix.matrix_data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from compressed import load_numpy
+from helpers import random_matrices
+from sparse_matrix import SparseMatrix
+
+
+class LoaderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.work_dir.cleanup)
+
+    def write_matrix_file(self, text, name="matrix.txt"):
+        path = os.path.join(self.work_dir.name, name)
+        with open(path, 'w') as f:
+            f.write(text)
+        return path
+
+
+SAMPLE_INPUTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "sample_inputs")
+
+EDGE_CASES = {
+    "crlf": "rows=3\r\ncols=3\r\n(0, 1, 2)\r\n(2, 2, -4)\r\n",
+    "blank_lines_and_spacing": "rows=3\ncols=3\n\n  ( 0 ,1,  2 )  \n\n(2,2,-4)\n",
+    "no_trailing_newline": "rows=2\ncols=2\n(0, 0, 1)\n(1, 1, 9)",
+    "duplicates_last_wins": "rows=2\ncols=2\n(0, 0, 1)\n(0, 0, 5)\n(1, 0, 3)\n(1, 0, 0)\n",
+    "zero_values": "rows=2\ncols=2\n(0, 0, 0)\n(1, 1, -1)\n",
+    "header_only": "rows=4\ncols=5\n",
+    "out_of_bounds": "rows=2\ncols=2\n(0, 0, 1)\n(2, 0, 1)\n",
+    "negative_index": "rows=2\ncols=2\n(-1, 0, 1)\n",
+    "float_value": "rows=2\ncols=2\n(0, 0, 1.5)\n",
+    "missing_parenthesis": "rows=2\ncols=2\n(0, 0, 1\n",
+    "bad_header": "rows=2\ncolumns=2\n(0, 0, 1)\n",
+}
+
+
+def load_outcome(load):
+    try:
+        matrix = load()
+    except ValueError as e:
+        return "ValueError", str(e)
+    if hasattr(matrix, "matrix_data"):
+        return matrix.rows, matrix.cols, matrix.matrix_data
+    return matrix.rows, matrix.cols, matrix.to_dict()
+
+
+class LoaderParityTest(LoaderTestCase):
+    def input_paths(self):
+        for name in sorted(os.listdir(SAMPLE_INPUTS)):
+            yield name, shutil.copy(os.path.join(SAMPLE_INPUTS, name), self.work_dir.name)
+        for name, text in EDGE_CASES.items():
+            yield name, self.write_matrix_file(text, name + ".txt")
+
+    def test_all_loading_paths_agree(self):
+        loaders = {
+            "mmap": lambda path: SparseMatrix(matrixFilePath=path, use_mmap=True),
+            "workers": lambda path: SparseMatrix(matrixFilePath=path, workers=3),
+            "load": lambda path: SparseMatrix.load(path),
+            "parse_cache": lambda path: SparseMatrix(matrixFilePath=path, parse_cache=True),
+            "coo": lambda path: SparseMatrix.load_coo(path),
+            "coo_mmap": lambda path: SparseMatrix.load_coo(path, use_mmap=True),
+            "coo_workers": lambda path: SparseMatrix.load_coo(path, workers=3),
+        }
+
+        for name, path in self.input_paths():
+            expected = load_outcome(lambda: SparseMatrix(matrixFilePath=path))
+            for loader_name, loader in loaders.items():
+                with self.subTest(input=name, loader=loader_name):
+                    self.assertEqual(load_outcome(lambda: loader(path)), expected)
+
+    def test_edge_case_contents(self):
+        expected = {
+            "crlf": {(0, 1): 2, (2, 2): -4},
+            "blank_lines_and_spacing": {(0, 1): 2, (2, 2): -4},
+            "no_trailing_newline": {(0, 0): 1, (1, 1): 9},
+            "duplicates_last_wins": {(0, 0): 5, (1, 0): 3},
+            "zero_values": {(1, 1): -1},
+            "header_only": {},
+        }
+        for name, matrix_data in expected.items():
+            with self.subTest(input=name):
+                path = self.write_matrix_file(EDGE_CASES[name], name + ".txt")
+                self.assertEqual(SparseMatrix(matrixFilePath=path).matrix_data, matrix_data)
+
+        for name in ("out_of_bounds", "negative_index", "float_value", "missing_parenthesis", "bad_header"):
+            with self.subTest(input=name):
+                with self.assertRaises(ValueError):
+                    SparseMatrix(matrixFilePath=self.write_matrix_file(EDGE_CASES[name], name + ".txt"))
+
+    def test_missing_file(self):
+        with self.assertRaisesRegex(FileNotFoundError, "Matrix file not found at:"):
+            SparseMatrix(matrixFilePath=os.path.join(self.work_dir.name, "missing.txt"))
+
+
+class ParallelLoaderTest(LoaderTestCase):
+    def test_values_outside_int64_match_serial_load(self):
+        lines = [f"({r}, {r % 7}, {r + 1})\n" for r in range(200)]
+        lines[150] = "(150, 3, 99999999999999999999999)\n"
+        path = self.write_matrix_file("rows=200\ncols=7\n" + "".join(lines))
+
+        serial = SparseMatrix(matrixFilePath=path)
+        self.assertEqual(serial.getElement(150, 3), 99999999999999999999999)
+        for workers in (2, 3):
+            with self.subTest(workers=workers):
+                self.assertEqual(SparseMatrix(matrixFilePath=path, workers=workers).matrix_data, serial.matrix_data)
+
+    def test_coo_loaders_name_the_entry_outside_int64(self):
+        lines = [f"({r}, {r % 7}, {r + 1})\n" for r in range(200)]
+        lines[150] = "(150, 3, 99999999999999999999999)\n"
+        path = self.write_matrix_file("rows=200\ncols=7\n" + "".join(lines))
+
+        for kwargs in ({}, {"use_mmap": True}, {"workers": 2}, {"workers": 3}):
+            with self.subTest(**kwargs):
+                with self.assertRaisesRegex(ValueError, r"\(150, 3, 99999999999999999999999\).*64-bit"):
+                    SparseMatrix.load_coo(path, **kwargs)
+
+
+class COOMatrixTest(unittest.TestCase):
+    def test_round_trip(self):
+        for matrix in random_matrices(9):
+            for row_sorted in (True, False):
+                coo_matrix = matrix.to_coo(row_sorted)
+                self.assertEqual(coo_matrix.nnz(), len(matrix.matrix_data))
+                self.assertEqual(SparseMatrix.from_coo(coo_matrix).matrix_data, matrix.matrix_data)
+                self.assertEqual(coo_matrix.to_csr().to_dict(), matrix.matrix_data)
+
+
+@unittest.skipIf(load_numpy() is None, "NumPy is not installed")
+class NumpyCOOLoaderTest(LoaderTestCase):
+    def test_eighteen_digit_values(self):
+        values = [123456789012345678, -123456789012345678, 999999999999999999, -999999999999999999]
+        path = self.write_matrix_file("rows=1\ncols=4\n" + "".join(f"(0, {c}, {v})\n" for c, v in enumerate(values)))
+
+        for kwargs in ({}, {"use_mmap": True}, {"workers": 2}):
+            with self.subTest(**kwargs):
+                coo_matrix = SparseMatrix.load_coo(path, **kwargs)
+                self.assertEqual(coo_matrix.to_dict(), {(0, c): v for c, v in enumerate(values)})
+
+
+if __name__ == "__main__":
+    unittest.main()
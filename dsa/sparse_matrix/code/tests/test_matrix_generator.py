@@ -0,0 +1,70 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import matrix_generator
+from sparse_matrix import SparseMatrix
+
+
+class GenerateEntriesTest(unittest.TestCase):
+    def test_exact_distinct_positions_for_every_pattern(self):
+        for pattern in matrix_generator.PATTERNS:
+            for ordering in matrix_generator.ORDERINGS:
+                for skew in (0.0, 1.5):
+                    with self.subTest(pattern=pattern, ordering=ordering, skew=skew):
+                        positions = list(matrix_generator.generate_entries(200, 150, 1500, ordering, skew, 0.0, 7,
+                                                                           pattern))
+                        self.assertEqual(len(positions), 1500)
+                        self.assertEqual(len(set(positions)), 1500)
+                        if ordering == "sorted":
+                            self.assertEqual(positions, sorted(positions))
+
+    def test_patterns_keep_entries_in_their_windows(self):
+        starts, ends = matrix_generator.column_windows(128, 128, 1000, "block_diagonal", block_size=64)
+        for r, c in matrix_generator.generate_entries(128, 128, 1000, pattern="block_diagonal", block_size=64):
+            self.assertEqual(r // 64, c // 64)
+            self.assertTrue(starts[r] <= c < ends[r])
+
+        for r, c in matrix_generator.generate_entries(100, 100, 300, pattern="banded", bandwidth=2):
+            self.assertLessEqual(abs(r - c), 2)
+
+    def test_duplicates_repeat_positions(self):
+        positions = list(matrix_generator.generate_entries(50, 50, 500, "shuffled", duplicates=0.5, seed=1))
+        self.assertGreater(len(positions), 500)
+        self.assertEqual(len(set(positions)), 500)
+
+    def test_rejects_more_entries_than_positions(self):
+        with self.assertRaises(ValueError):
+            matrix_generator.generate_entries(2, 2, 5)
+        with self.assertRaises(ValueError):
+            matrix_generator.generate_entries(10, 10, 40, pattern="banded", bandwidth=1)
+
+
+class WriteMatrixTest(unittest.TestCase):
+    def test_output_loads_with_sparse_matrix(self):
+        with tempfile.TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir, "matrix.txt")
+            with open(path, 'w') as f:
+                lines = matrix_generator.write_matrix(f, 40, 30, 600, -5, 5, "shuffled", 2.0, 0.2, 3, "banded")
+
+            matrix = SparseMatrix(matrixFilePath=path)
+            self.assertEqual((matrix.rows, matrix.cols), (40, 30))
+            self.assertEqual(len(matrix.matrix_data), 600)
+            self.assertGreaterEqual(lines, 600)
+            self.assertTrue(all(-5 <= val <= 5 for val in matrix.matrix_data.values()))
+
+    def test_invalid_options_write_nothing(self):
+        for kwargs in ({"nnz": 9}, {"nnz": 1, "min_value": 0, "max_value": 0}, {"nnz": 1, "duplicates": 1.0}):
+            with self.subTest(**kwargs):
+                out = io.StringIO()
+                with self.assertRaises(ValueError):
+                    matrix_generator.write_matrix(out, 2, 2, **kwargs)
+                self.assertEqual(out.getvalue(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
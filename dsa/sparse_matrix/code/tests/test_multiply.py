@@ -0,0 +1,102 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from helpers import expected_product, make_matrix, operand_pairs, random_matrix
+
+
+class RowIndexedMultiplyTest(unittest.TestCase):
+    def test_matches_dense_product(self):
+        for left, right in operand_pairs(11):
+            with self.subTest(shape=(left.rows, left.cols, right.cols)):
+                self.assertEqual(left.multiply(right).matrix_data, expected_product(left, right))
+
+    def test_cancelling_products_are_not_stored(self):
+        left = make_matrix(1, 2, {(0, 0): 2, (0, 1): 1})
+        right = make_matrix(2, 1, {(0, 0): 3, (1, 0): -6})
+        self.assertEqual(left.multiply(right).matrix_data, {})
+
+    def test_rejects_mismatched_dimensions(self):
+        with self.assertRaises(ValueError):
+            make_matrix(2, 3, {}).multiply(make_matrix(2, 3, {}))
+
+
+class NarrowOperandMultiplyTest(unittest.TestCase):
+    def test_tall_left_and_narrow_right_operands(self):
+        rnd = random.Random(3)
+        for _ in range(20):
+            left = random_matrix(rnd, rnd.randint(10, 30), rnd.randint(1, 6), 60)
+            right = random_matrix(rnd, left.cols, rnd.randint(1, 3), 10)
+            self.assertEqual(left.multiply(right).matrix_data, expected_product(left, right))
+
+
+class ParallelMultiplyTest(unittest.TestCase):
+    def test_workers_and_csr_match_dense_product(self):
+        for left, right in operand_pairs(14):
+            expected = expected_product(left, right)
+            with self.subTest(shape=(left.rows, left.cols, right.cols)):
+                self.assertEqual(left.multiply(right, workers=2).matrix_data, expected)
+                self.assertEqual(left.to_csr().multiply(right.to_csr()).to_dict(), expected)
+                self.assertEqual(left.to_csr().multiply(right.to_csr(), workers=3).to_dict(), expected)
+
+    def test_rejects_mismatched_dimensions(self):
+        with self.assertRaises(ValueError):
+            make_matrix(3, 2, {}).multiply(make_matrix(3, 2, {}), workers=2)
+
+    def test_products_beyond_int64_fall_back_to_dict_kernel(self):
+        left = make_matrix(2, 2, {(0, 0): 2 ** 40, (1, 1): 3})
+        right = make_matrix(2, 2, {(0, 0): 2 ** 40, (1, 0): 5})
+        expected = {(0, 0): 2 ** 80, (1, 0): 15}
+        self.assertEqual(left.multiply(right, workers=2).matrix_data, expected)
+        self.assertEqual(left.multiply(right).matrix_data, expected)
+
+        left_csr, right_csr = left.to_csr(), right.to_csr()
+        for workers in (1, 2):
+            with self.assertRaisesRegex(ValueError, "64-bit"):
+                left_csr.multiply(right_csr, workers)
+        with self.assertRaisesRegex(ValueError, "64-bit"):
+            left_csr.multiply_numeric(right_csr, left_csr.multiply_symbolic(right_csr))
+
+
+class TwoPhaseMultiplyTest(unittest.TestCase):
+    def test_numeric_phase_matches_dense_product(self):
+        for left, right in operand_pairs(15):
+            left_csr, right_csr = left.to_csr(), right.to_csr()
+            symbolic = left_csr.multiply_symbolic(right_csr)
+            self.assertEqual(left_csr.multiply_numeric(right_csr, symbolic).to_dict(), expected_product(left, right))
+
+            scaled = make_matrix(left.rows, left.cols, {key: 2 * val for key, val in left.matrix_data.items()})
+            self.assertEqual(scaled.to_csr().multiply_numeric(right_csr, symbolic).to_dict(),
+                             expected_product(scaled, right))
+
+    def test_rejects_different_sparsity_pattern(self):
+        left = make_matrix(2, 2, {(0, 0): 1})
+        right = make_matrix(2, 2, {(0, 1): 2})
+        symbolic = left.to_csr().multiply_symbolic(right.to_csr())
+        with self.assertRaises(ValueError):
+            make_matrix(2, 2, {(1, 0): 1}).to_csr().multiply_numeric(right.to_csr(), symbolic)
+
+
+class MaskedMultiplyTest(unittest.TestCase):
+    def test_matches_masked_dense_product(self):
+        rnd = random.Random(16)
+        for left, right in operand_pairs(16):
+            expected = expected_product(left, right)
+            full_mask = make_matrix(left.rows, right.cols, {(r, c): 1 for r in range(left.rows)
+                                                            for c in range(right.cols)})
+            mask = random_matrix(rnd, left.rows, right.cols, 10)
+            with self.subTest(shape=(left.rows, left.cols, right.cols)):
+                self.assertEqual(left.multiply_masked(right, full_mask).matrix_data, expected)
+                self.assertEqual(left.multiply_masked(right, mask).matrix_data,
+                                 {key: val for key, val in expected.items() if key in mask.matrix_data})
+
+    def test_rejects_mismatched_mask(self):
+        with self.assertRaises(ValueError):
+            make_matrix(2, 3, {}).multiply_masked(make_matrix(3, 2, {}), make_matrix(3, 3, {}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from helpers import make_matrix, random_matrices
+
+
+def baseline_string(matrix):
+    output = f"rows={matrix.rows}\ncols={matrix.cols}\n"
+    for r, c in sorted(matrix.matrix_data.keys()):
+        output += f"({r}, {c}, {matrix.matrix_data[(r, c)]})\n"
+    return output
+
+
+class WriteToTest(unittest.TestCase):
+    def matrices(self):
+        yield from random_matrices(18)
+        yield from (matrix.transpose() for matrix in random_matrices(19))
+        yield make_matrix(2, 3, {})
+
+    def written(self, matrix):
+        out = io.StringIO()
+        matrix.write_to(out)
+        return out.getvalue()
+
+    def test_dict_form_matches_baseline_format(self):
+        for matrix in self.matrices():
+            expected = baseline_string(matrix)
+            self.assertEqual(matrix.to_string(), expected)
+            self.assertEqual(self.written(matrix), expected)
+
+        big = make_matrix(1, 2, {(0, 1): 2 ** 70, (0, 0): -(2 ** 70)})
+        self.assertEqual(self.written(big), baseline_string(big))
+
+    def test_csr_form_matches_baseline_format(self):
+        for matrix in self.matrices():
+            csr_matrix = matrix.to_csr()
+            expected = baseline_string(matrix)
+            self.assertEqual(csr_matrix.to_string(), expected)
+            self.assertEqual(self.written(csr_matrix), expected)
+
+    def test_written_file_matches_to_string(self):
+        with tempfile.TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir, "matrix.txt")
+            for matrix in random_matrices(20, count=5):
+                for form in (matrix, matrix.to_csr()):
+                    with open(path, 'w') as f:
+                        form.write_to(f)
+                    with open(path, 'r', newline='') as f:
+                        self.assertEqual(f.read(), matrix.to_string())
+
+
+if __name__ == "__main__":
+    unittest.main()
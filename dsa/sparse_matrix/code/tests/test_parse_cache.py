@@ -0,0 +1,93 @@
+import os
+import struct
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from compressed import BINARY_HEADER_SIZE
+from sparse_matrix import CACHE_KEY_SUFFIX, CACHE_SUFFIX, SparseMatrix
+
+
+class ParseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.work_dir.cleanup)
+        self.path = os.path.join(self.work_dir.name, "matrix.txt")
+        self.cache_path = self.path + CACHE_SUFFIX
+        self.write_input("rows=3\ncols=3\n(0, 1, 5)\n(2, 2, -1)\n")
+
+    def write_input(self, text):
+        with open(self.path, 'w') as f:
+            f.write(text)
+
+    def load(self):
+        with mock.patch.object(SparseMatrix, "_load_from_file", autospec=True,
+                               side_effect=SparseMatrix._load_from_file) as parse:
+            matrix = SparseMatrix(self.path, parse_cache=True)
+        return matrix, parse.call_count
+
+    def test_second_load_uses_sidecar(self):
+        first, parses = self.load()
+        self.assertEqual(parses, 1)
+        self.assertTrue(os.path.exists(self.cache_path))
+        self.assertTrue(os.path.exists(self.cache_path + CACHE_KEY_SUFFIX))
+
+        second, parses = self.load()
+        self.assertEqual(parses, 0)
+        self.assertEqual(second.matrix_data, first.matrix_data)
+        self.assertEqual((second.rows, second.cols), (3, 3))
+
+    def test_touched_input_with_same_content_uses_sidecar(self):
+        self.load()
+        os.utime(self.path, ns=(1, 1))
+        _, parses = self.load()
+        self.assertEqual(parses, 0)
+
+    def test_same_size_edit_with_restored_mtime_is_reparsed(self):
+        self.load()
+        stat = os.stat(self.path)
+        self.write_input("rows=3\ncols=3\n(0, 1, 7)\n(2, 2, -1)\n")
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        matrix, parses = self.load()
+        self.assertEqual(parses, 1)
+        self.assertEqual(matrix.getElement(0, 1), 7)
+        self.assertEqual(self.load()[0].getElement(0, 1), 7)
+
+    def test_tampered_sidecar_is_rebuilt(self):
+        self.load()
+        with open(self.cache_path, 'r+b') as f:
+            f.seek(BINARY_HEADER_SIZE + 8 * 4)
+            f.write(struct.pack("<q", 42))
+
+        matrix, parses = self.load()
+        self.assertEqual(parses, 1)
+        self.assertEqual(matrix.getElement(0, 1), 5)
+        self.assertEqual(self.load()[1], 0)
+
+    def test_corrupt_sidecar_and_key_are_rebuilt(self):
+        for damaged_path in (self.cache_path, self.cache_path + CACHE_KEY_SUFFIX):
+            with self.subTest(damaged_path=damaged_path):
+                self.load()
+                with open(damaged_path, 'wb') as f:
+                    f.write(b"junk")
+                matrix, parses = self.load()
+                self.assertEqual(parses, 1)
+                self.assertEqual(matrix.getElement(2, 2), -1)
+
+    def test_values_outside_int64_are_not_cached(self):
+        self.write_input("rows=1\ncols=1\n(0, 0, 99999999999999999999999)\n")
+        matrix, _ = self.load()
+        self.assertEqual(matrix.getElement(0, 0), 99999999999999999999999)
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_missing_input(self):
+        with self.assertRaisesRegex(FileNotFoundError, "Matrix file not found at:"):
+            SparseMatrix(self.path + ".missing", parse_cache=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from compressed import load_numpy
+from helpers import dense_product, make_matrix, random_matrices, to_dense
+
+
+class MatvecTest(unittest.TestCase):
+    def test_matches_dense_products(self):
+        rnd = random.Random(8)
+        for matrix in random_matrices(10):
+            dense = to_dense(matrix)
+            x = [rnd.randint(-4, 4) for _ in range(matrix.cols)]
+            y = [rnd.randint(-4, 4) for _ in range(matrix.rows)]
+
+            self.assertEqual(list(matrix.matvec(x)), [sum(a * b for a, b in zip(row, x)) for row in dense])
+            self.assertEqual(list(matrix.rmatvec(y)), [sum(a * b for a, b in zip(col, y)) for col in zip(*dense)])
+
+    @unittest.skipIf(load_numpy() is None, "NumPy is not installed")
+    def test_ndarray_vectors(self):
+        np = load_numpy()
+        rnd = random.Random(9)
+        for matrix in random_matrices(11):
+            x = [rnd.randint(-4, 4) for _ in range(matrix.cols)]
+            y = [rnd.randint(-4, 4) for _ in range(matrix.rows)]
+            self.assertEqual(matrix.matvec(np.array(x)).tolist(), list(matrix.matvec(x)))
+            self.assertEqual(matrix.rmatvec(np.array(y)).tolist(), list(matrix.rmatvec(y)))
+
+    def test_rejects_wrong_vector_length(self):
+        matrix = make_matrix(2, 3, {(0, 1): 1})
+        with self.assertRaises(ValueError):
+            matrix.matvec([1, 2])
+        with self.assertRaises(ValueError):
+            matrix.rmatvec([1, 2, 3])
+
+
+class MultiplyDenseTest(unittest.TestCase):
+    def dense_blocks(self, seed):
+        rnd = random.Random(seed)
+        for matrix in random_matrices(seed):
+            yield matrix, [[rnd.randint(-4, 4) for _ in range(3)] for _ in range(matrix.cols)]
+
+    def test_matches_dense_product(self):
+        for matrix, block in self.dense_blocks(12):
+            expected = dense_product(to_dense(matrix), block)
+            self.assertEqual([list(row) for row in matrix.multiply_dense(block)], expected)
+            for block_rows in (1, 2, 7):
+                with self.subTest(block_rows=block_rows):
+                    self.assertEqual(matrix.to_csr().multiply_dense(block, block_rows), expected)
+
+    @unittest.skipIf(load_numpy() is None, "NumPy is not installed")
+    def test_ndarray_blocks(self):
+        np = load_numpy()
+        for matrix, block in self.dense_blocks(13):
+            expected = dense_product(to_dense(matrix), block)
+            for block_rows in (1, 2, 7):
+                with self.subTest(block_rows=block_rows):
+                    self.assertEqual(matrix.to_csr().multiply_dense(np.array(block), block_rows).tolist(), expected)
+
+    def test_rejects_wrong_block_height(self):
+        with self.assertRaises(ValueError):
+            make_matrix(2, 3, {(0, 1): 1}).multiply_dense([[1], [2]])
+
+
+if __name__ == "__main__":
+    unittest.main()